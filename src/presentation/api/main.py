@@ -21,10 +21,12 @@ from src.presentation.api.middleware import (
     setup_cors,
 )
 from src.presentation.api.routes import (
+    backtesting,
     bots,
     health,
     metrics,
     orders,
+    paper,
     positions,
     risk,
     wallet,
@@ -105,6 +107,8 @@ def create_app() -> FastAPI:
     app.include_router(metrics.router, prefix="/api/v1")
     app.include_router(wallet.router, prefix="/api/v1")
     app.include_router(risk.router, prefix="/api/v1")
+    app.include_router(paper.router, prefix="/api/v1/paper", tags=["paper"])
+    app.include_router(backtesting.router, prefix="/api/v1/backtesting", tags=["backtesting"])
     app.include_router(websocket_router, prefix="/api/v1")
     
     logger.info("app_created", extra={"routes": len(app.routes)})
@@ -1,21 +1,25 @@
 """API Routes."""
 
 from src.presentation.api.routes import (
+    backtesting,
     bots,
     health,
     metrics,
     orders,
+    paper,
     positions,
     risk,
     wallet,
 )
 
 __all__ = [
+    "backtesting",
     "bots",
     "positions",
     "orders",
     "metrics",
     "health",
+    "paper",
     "wallet",
     "risk",
 ]
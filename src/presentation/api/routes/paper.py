@@ -26,15 +26,21 @@ async def get_paper_wallet(redis: Redis):
     Returns:
         Paper wallet data
     """
-    repo = PaperWalletRepository(redis)
-    service = PaperWalletService()
-    
-    # Get or create wallet
+    wallet = await _get_or_create_wallet(PaperWalletRepository(redis))
+    return _wallet_data(wallet)
+
+
+async def _get_or_create_wallet(repo: PaperWalletRepository):
+    """Load the paper wallet, creating and saving a fresh one if missing."""
     wallet = await repo.get_wallet()
     if not wallet:
-        wallet = service.create_wallet()
+        wallet = PaperWalletService().create_wallet()
         await repo.save_wallet(wallet)
-    
+    return wallet
+
+
+def _wallet_data(wallet) -> dict:
+    """Serialize a paper wallet."""
     return {
         "wallet_id": str(wallet.wallet_id),
         "balance": float(wallet.balance),
@@ -105,24 +111,26 @@ async def get_paper_positions(
     repo = PaperWalletRepository(redis)
     positions = await repo.get_positions(status=status)
     
-    return [
-        {
-            "position_id": str(pos.position_id),
-            "market_id": pos.market_id,
-            "side": pos.side,
-            "size": float(pos.size),
-            "entry_price": float(pos.entry_price),
-            "current_price": float(pos.current_price) if pos.current_price else None,
-            "zone": pos.zone,
-            "opened_at": pos.opened_at.isoformat(),
-            "closed_at": pos.closed_at.isoformat() if pos.closed_at else None,
-            "exit_price": float(pos.exit_price) if pos.exit_price else None,
-            "unrealized_pnl": float(pos.unrealized_pnl) if pos.unrealized_pnl else None,
-            "realized_pnl": float(pos.realized_pnl) if pos.realized_pnl else None,
-            "is_open": pos.is_open,
-        }
-        for pos in positions
-    ]
+    return [_position_data(pos) for pos in positions]
+
+
+def _position_data(pos) -> dict:
+    """Serialize a paper position."""
+    return {
+        "position_id": str(pos.position_id),
+        "market_id": pos.market_id,
+        "side": pos.side,
+        "size": float(pos.size),
+        "entry_price": float(pos.entry_price),
+        "current_price": float(pos.current_price) if pos.current_price else None,
+        "zone": pos.zone,
+        "opened_at": pos.opened_at.isoformat(),
+        "closed_at": pos.closed_at.isoformat() if pos.closed_at else None,
+        "exit_price": float(pos.exit_price) if pos.exit_price else None,
+        "unrealized_pnl": float(pos.unrealized_pnl) if pos.unrealized_pnl else None,
+        "realized_pnl": float(pos.realized_pnl) if pos.realized_pnl else None,
+        "is_open": pos.is_open,
+    }
 
 
 @router.get("/metrics")
@@ -150,7 +158,11 @@ async def get_paper_metrics(redis: Redis):
     
     positions = await repo.get_positions(status="closed")
     
-    # Calculate metrics
+    return _metrics_data(wallet, positions)
+
+
+def _metrics_data(wallet, positions) -> dict:
+    """Performance metrics of a wallet from its closed positions."""
     total_wins = sum(pos.realized_pnl for pos in positions if pos.realized_pnl and pos.realized_pnl > 0)
     total_losses = sum(abs(pos.realized_pnl) for pos in positions if pos.realized_pnl and pos.realized_pnl < 0)
     
@@ -168,3 +180,28 @@ async def get_paper_metrics(redis: Redis):
         "avg_win": float(total_wins / wallet.winning_trades) if wallet.winning_trades > 0 else 0,
         "avg_loss": float(total_losses / wallet.losing_trades) if wallet.losing_trades > 0 else 0,
     }
+
+
+@router.get("/summary")
+async def get_paper_summary(redis: Redis):
+    """Get paper wallet, metrics and positions in one response.
+    
+    Args:
+        redis: Redis client
+        
+    Returns:
+        Dict with ``wallet``, ``metrics`` and ``positions`` keys
+    """
+    repo = PaperWalletRepository(redis)
+    
+    # Read the wallet once, then derive everything else from it and a
+    # single positions read, so the three parts describe one snapshot
+    wallet = await _get_or_create_wallet(repo)
+    positions = await repo.get_positions()
+    closed = [pos for pos in positions if not pos.is_open]
+    
+    return {
+        "wallet": _wallet_data(wallet),
+        "metrics": _metrics_data(wallet, closed),
+        "positions": [_position_data(pos) for pos in positions],
+    }
@@ -0,0 +1,84 @@
+"""Shared API clients for dashboard pages.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import os
+from typing import Any, Dict
+
+import streamlit as st
+from requests.adapters import HTTPAdapter
+
+from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard.connection import PETSConnection
+from src.presentation.dashboard.websocket_client import WebSocketClient
+
+API_BASE_URL = os.getenv("PETS_API_URL", "http://localhost:8000")
+WS_BASE_URL = os.getenv("PETS_WS_URL", "ws://localhost:8000")
+
+
+@st.cache_resource
+def get_api_client(base_url: str = API_BASE_URL) -> APIClient:
+    """Get the process-wide API client for a base URL.
+    
+    Every page and session shares one client, and with it one pooled
+    ``requests`` session, instead of building a client per rerun.
+    
+    Args:
+        base_url: Base URL of the API
+    
+    Returns:
+        Shared API client
+    
+    Examples:
+        >>> client = get_api_client()
+        >>> bots = client.get_bot_list()
+    """
+    client = APIClient(base_url=base_url)
+    adapter = HTTPAdapter(max_retries=2, pool_maxsize=32)
+    client.session.mount("http://", adapter)
+    client.session.mount("https://", adapter)
+    return client
+
+
+def get_connection() -> PETSConnection:
+    """Get the shared async API connection.
+    
+    The async client's pool is bound to the connection's event loop, so
+    it is shared through ``st.connection`` rather than ``cache_resource``.
+    
+    Returns:
+        Shared PETS API connection
+    """
+    return st.connection("pets_api", type=PETSConnection, base_url=API_BASE_URL)
+
+
+@st.cache_resource
+def get_ws_client(base_url: str = WS_BASE_URL) -> WebSocketClient:
+    """Get the process-wide WebSocket client for a base URL.
+    
+    Args:
+        base_url: Base WebSocket URL
+    
+    Returns:
+        Shared WebSocket client
+    """
+    return WebSocketClient(base_url=base_url)
+
+
+@st.cache_data(ttl=1, show_spinner=False)
+def get_portfolio_metrics_cached(base_url: str, _client: Any) -> Dict[str, Any]:
+    """Get portfolio metrics, memoized per API and one-second bucket.
+    
+    Every page and session refreshing within the same second shares one
+    backend aggregation instead of each triggering its own.
+    
+    Args:
+        base_url: Base URL of the API ``_client`` talks to (cache key)
+        _client: Client exposing ``get_portfolio_metrics`` (not hashed)
+    
+    Returns:
+        Portfolio metrics dictionary
+    """
+    return _client.get_portfolio_metrics()
@@ -4,36 +4,139 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+import pyarrow as pa
 
 logger = logging.getLogger(__name__)
 
+# Column layouts for the Arrow-returning endpoints. Missing keys become nulls.
+BOT_SCHEMA = pa.schema([
+    ("bot_id", pa.int64()),
+    ("strategy_type", pa.string()),
+    ("state", pa.string()),
+    ("capital_allocated", pa.float64()),
+    ("total_pnl", pa.float64()),
+    ("roi", pa.float64()),
+])
+
+POSITION_SCHEMA = pa.schema([
+    ("position_id", pa.int64()),
+    ("bot_id", pa.int64()),
+    ("market_id", pa.string()),
+    ("side", pa.string()),
+    ("size", pa.float64()),
+    ("entry_price", pa.float64()),
+    ("current_price", pa.float64()),
+    ("unrealized_pnl", pa.float64()),
+    ("zone", pa.int64()),
+])
+
 
 class APIClient:
     """HTTP client for PETS API."""
 
-    def __init__(self, base_url: str = "http://localhost:8000", api_key: str = "") -> None:
+    def __init__(
+        self,
+        base_url: str = "http://localhost:8000",
+        api_key: str = "",
+        limits: Optional[httpx.Limits] = None,
+    ) -> None:
         """Initialize API client.
         
         Args:
             base_url: Base URL for API
             api_key: API key for authentication
+            limits: Optional connection pool limits
         """
         self.base_url = base_url
         self.api_key = api_key
+        self._pending: Dict[Tuple[str, str], asyncio.Task] = {}
         self.client = httpx.AsyncClient(
             base_url=base_url,
             headers={"X-API-Key": api_key} if api_key else {},
             timeout=30.0,
+            limits=limits or httpx.Limits(),
+            event_hooks={"request": [self._detach_pending]},
         )
 
     async def close(self) -> None:
         """Close HTTP client."""
         await self.client.aclose()
 
+    # Generic requests
+    async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """Send GET request.
+        
+        Identical GETs (same path and params) issued while one is in flight
+        share its response. A finished GET is never reused, and any write
+        detaches in-flight GETs so later reads see it.
+        
+        Args:
+            path: API path
+            params: Query parameters
+            
+        Returns:
+            Decoded JSON response
+        """
+        key = (path, repr(sorted((params or {}).items())))
+        task = self._pending.get(key)
+        
+        if task is None:
+            task = asyncio.create_task(self._get(path, params))
+            self._pending[key] = task
+            task.add_done_callback(lambda done: self._drop_pending(key, done))
+        
+        return await asyncio.shield(task)
+
+    async def _get(self, path: str, params: Optional[Dict[str, Any]]) -> Any:
+        """Send one GET request without coalescing."""
+        response = await self.client.get(path, params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def _drop_pending(self, key: Tuple[str, str], task: asyncio.Task) -> None:
+        """Forget a shared GET once it completes."""
+        if self._pending.get(key) is task:
+            del self._pending[key]
+
+    async def _detach_pending(self, request: httpx.Request) -> None:
+        """Stop sharing in-flight GETs once any write is sent."""
+        if request.method != "GET":
+            self._pending.clear()
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        """Send POST request.
+        
+        Args:
+            path: API path
+            json: JSON body
+            
+        Returns:
+            Decoded JSON response
+        """
+        response = await self.client.post(path, json=json)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def put(self, path: str, json: Optional[Dict[str, Any]] = None) -> Any:
+        """Send PUT request.
+        
+        Args:
+            path: API path
+            json: JSON body
+            
+        Returns:
+            Decoded JSON response
+        """
+        response = await self.client.put(path, json=json)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
     # Bots endpoints
     async def list_bots(self) -> Dict[str, Any]:
         """Get list of bots.
@@ -43,7 +146,16 @@ class APIClient:
         """
         response = await self.client.get("/api/v1/bots")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def list_bots_arrow(self) -> pa.Table:
+        """Get list of bots as an Arrow table.
+        
+        Returns:
+            Bots table with ``BOT_SCHEMA`` columns
+        """
+        result = await self.list_bots()
+        return pa.Table.from_pylist(result.get("bots", []), schema=BOT_SCHEMA)
 
     async def get_bot(self, bot_id: int) -> Dict[str, Any]:
         """Get bot details.
@@ -56,7 +168,7 @@ class APIClient:
         """
         response = await self.client.get(f"/api/v1/bots/{bot_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def start_bot(self, bot_id: int) -> Dict[str, Any]:
         """Start bot.
@@ -69,7 +181,7 @@ class APIClient:
         """
         response = await self.client.post(f"/api/v1/bots/{bot_id}/start")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def stop_bot(self, bot_id: int) -> Dict[str, Any]:
         """Stop bot.
@@ -82,7 +194,7 @@ class APIClient:
         """
         response = await self.client.post(f"/api/v1/bots/{bot_id}/stop")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def pause_bot(self, bot_id: int) -> Dict[str, Any]:
         """Pause bot.
@@ -95,7 +207,7 @@ class APIClient:
         """
         response = await self.client.post(f"/api/v1/bots/{bot_id}/pause")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def update_bot_config(self, bot_id: int, config: Dict[str, Any]) -> Dict[str, Any]:
         """Update bot configuration.
@@ -109,7 +221,7 @@ class APIClient:
         """
         response = await self.client.put(f"/api/v1/bots/{bot_id}/config", json={"config": config})
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # Positions endpoints
     async def list_positions(self, bot_id: Optional[int] = None) -> Dict[str, Any]:
@@ -124,7 +236,19 @@ class APIClient:
         params = {"bot_id": bot_id} if bot_id else {}
         response = await self.client.get("/api/v1/positions", params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
+
+    async def list_positions_arrow(self, bot_id: Optional[int] = None) -> pa.Table:
+        """Get list of positions as an Arrow table.
+        
+        Args:
+            bot_id: Optional bot filter
+            
+        Returns:
+            Positions table with ``POSITION_SCHEMA`` columns
+        """
+        result = await self.list_positions(bot_id=bot_id)
+        return pa.Table.from_pylist(result.get("positions", []), schema=POSITION_SCHEMA)
 
     async def get_position(self, position_id: int) -> Dict[str, Any]:
         """Get position details.
@@ -137,7 +261,7 @@ class APIClient:
         """
         response = await self.client.get(f"/api/v1/positions/{position_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def close_position(self, position_id: int) -> Dict[str, Any]:
         """Close position.
@@ -150,7 +274,7 @@ class APIClient:
         """
         response = await self.client.post(f"/api/v1/positions/{position_id}/close")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # Orders endpoints
     async def list_orders(self, bot_id: Optional[int] = None) -> Dict[str, Any]:
@@ -165,7 +289,7 @@ class APIClient:
         params = {"bot_id": bot_id} if bot_id else {}
         response = await self.client.get("/api/v1/orders", params=params)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_order(self, order_id: str) -> Dict[str, Any]:
         """Get order details.
@@ -178,7 +302,7 @@ class APIClient:
         """
         response = await self.client.get(f"/api/v1/orders/{order_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def place_order(
         self,
@@ -209,7 +333,7 @@ class APIClient:
         }
         response = await self.client.post("/api/v1/orders", json=payload)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def cancel_order(self, order_id: str) -> Dict[str, Any]:
         """Cancel order.
@@ -222,7 +346,7 @@ class APIClient:
         """
         response = await self.client.delete(f"/api/v1/orders/{order_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # Metrics endpoints
     async def get_bot_metrics(self, bot_id: int) -> Dict[str, Any]:
@@ -236,7 +360,7 @@ class APIClient:
         """
         response = await self.client.get(f"/api/v1/metrics/bots/{bot_id}")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def get_portfolio_metrics(self) -> Dict[str, Any]:
         """Get portfolio metrics.
@@ -246,7 +370,7 @@ class APIClient:
         """
         response = await self.client.get("/api/v1/metrics/portfolio")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # Wallet endpoints
     async def get_wallet_balance(self) -> Dict[str, Any]:
@@ -257,7 +381,7 @@ class APIClient:
         """
         response = await self.client.get("/api/v1/wallet/balance")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def topup_wallet(self, amount: float) -> Dict[str, Any]:
         """Top up hot wallet.
@@ -270,7 +394,7 @@ class APIClient:
         """
         response = await self.client.post("/api/v1/wallet/topup", json={"amount": amount})
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     async def rebalance_wallet(self) -> Dict[str, Any]:
         """Rebalance hot wallet.
@@ -280,7 +404,7 @@ class APIClient:
         """
         response = await self.client.post("/api/v1/wallet/rebalance")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # Risk endpoints
     async def get_risk_metrics(self) -> Dict[str, Any]:
@@ -289,19 +413,15 @@ class APIClient:
         Returns:
             Risk metrics
         """
-        response = await self.client.get("/api/v1/risk/metrics")
-        response.raise_for_status()
-        return response.json()
+        return await self.get("/api/v1/risk/metrics")
 
-    async def get_circuit_breakers(self) -> Dict[str, Any]:
+    async def get_circuit_breakers(self) -> List[Dict[str, Any]]:
         """Get circuit breaker statuses.
         
         Returns:
-            Circuit breaker statuses
+            List of circuit breaker statuses
         """
-        response = await self.client.get("/api/v1/risk/circuit-breakers")
-        response.raise_for_status()
-        return response.json()
+        return await self.get("/api/v1/risk/circuit-breakers")
 
     async def emergency_halt(self) -> Dict[str, Any]:
         """Trigger emergency halt.
@@ -311,7 +431,7 @@ class APIClient:
         """
         response = await self.client.post("/api/v1/risk/emergency-halt")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
 
     # Health endpoints
     async def check_health(self) -> Dict[str, Any]:
@@ -322,4 +442,4 @@ class APIClient:
         """
         response = await self.client.get("/api/v1/health/ready")
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
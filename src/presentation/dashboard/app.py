@@ -4,8 +4,18 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
+import plotly.io as pio
 import streamlit as st
 
+# Serialize Plotly figures with orjson when it is installed; this is
+# process-wide, so it is set once here rather than on a component import
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    pass
+else:
+    pio.json.config.default_engine = "orjson"
+
 # Page config
 st.set_page_config(
     page_title="PETS - Polymarket Elite Trading System",
@@ -4,12 +4,96 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
+import orjson
 import requests
-from typing import Dict, List, Optional, Any
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Optional
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Target bot state -> per-bot route used when /bots/batch is unavailable
+BOT_STATE_ACTIONS = {"ANALYZING": "start", "STOPPED": "stop", "PAUSED": "pause"}
+
+# Status codes meaning the API has no /bots/batch route: 404, or 405 when
+# the path matches GET /bots/{bot_id}
+NO_BATCH_STATUSES = {404, 405}
+
+
+class DataLoader:
+    """Coalesce individual requests into batched calls.
+    
+    Keys loaded within ``wait_ms`` of the first pending key are flushed
+    together through one ``batch_fn(keys)`` call on a timer thread. Duplicate
+    keys in the same window share a single result. ``batch_fn`` may return
+    an exception for a key to fail only that key's future.
+    
+    Examples:
+        >>> loader = DataLoader(lambda keys: [k * 2 for k in keys])
+        >>> loader.load(21).result()
+        42
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Hashable]], List[Any]],
+        wait_ms: float = 5,
+    ) -> None:
+        """Initialize data loader.
+        
+        Args:
+            batch_fn: Resolves a list of keys to results in the same order
+            wait_ms: Batching window in milliseconds
+        """
+        self.batch_fn = batch_fn
+        self.wait_ms = wait_ms
+        self._pending: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: Hashable) -> Future:
+        """Queue key for the next batch.
+        
+        Args:
+            key: Request key
+        
+        Returns:
+            Future resolved when the batch is flushed
+        """
+        with self._lock:
+            future = self._pending.get(key)
+            
+            if future is None:
+                if not self._pending:
+                    timer = threading.Timer(self.wait_ms / 1000, self._flush)
+                    timer.daemon = True
+                    timer.start()
+                
+                future = Future()
+                self._pending[key] = future
+        
+        return future
+
+    def _flush(self) -> None:
+        """Resolve all pending keys with one batch call."""
+        with self._lock:
+            batch, self._pending = self._pending, {}
+        
+        keys = list(batch)
+        
+        try:
+            results = self.batch_fn(keys)
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        
+        for key, result in zip(keys, results):
+            if isinstance(result, BaseException):
+                batch[key].set_exception(result)
+            else:
+                batch[key].set_result(result)
+
 
 class APIClient:
     """HTTP client for PETS backend API.
@@ -36,6 +120,19 @@ class APIClient:
         
         if api_key:
             self.session.headers["X-API-Key"] = api_key
+        
+        self._bot_list_loader = DataLoader(self._fetch_bot_lists)
+        self._bot_op_loader = DataLoader(self._run_bot_ops)
+
+    def health_check(self) -> Dict[str, Any]:
+        """Check API readiness and its database dependencies.
+        
+        Returns:
+            Dict with ``status`` and ``database``/``redis``/``websocket`` flags
+        """
+        response = self.session.get(f"{self.base_url}/api/v1/health/ready")
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     def get_portfolio_metrics(self) -> Dict[str, Any]:
         """Get portfolio-level metrics.
@@ -46,7 +143,7 @@ class APIClient:
         try:
             response = self.session.get(f"{self.base_url}/api/v1/metrics/portfolio")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to fetch portfolio metrics: {e}")
             return self._get_default_metrics()
@@ -60,7 +157,7 @@ class APIClient:
         try:
             response = self.session.get(f"{self.base_url}/api/v1/bots")
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to fetch bot list: {e}")
             return []
@@ -79,11 +176,209 @@ class APIClient:
                 f"{self.base_url}/api/v1/metrics/bots/{bot_id}"
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to fetch bot {bot_id} metrics: {e}")
             return {}
 
+    def get_bots_metrics_bulk(self, bot_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """Get metrics for several bots in one request.
+        
+        Falls back to concurrent per-bot requests when the API has no bulk
+        endpoint.
+        
+        Args:
+            bot_ids: Bot IDs
+        
+        Returns:
+            Bot metrics dictionaries keyed by bot ID
+        """
+        if not bot_ids:
+            return {}
+        
+        try:
+            response = self.session.post(
+                f"{self.base_url}/api/v1/bots/metrics/bulk",
+                json={"bot_ids": list(bot_ids)},
+            )
+            if response.status_code not in NO_BATCH_STATUSES:
+                response.raise_for_status()
+                return {int(bot_id): m for bot_id, m in orjson.loads(response.content).items()}
+        except Exception as e:
+            logger.error(f"Failed to fetch bulk bot metrics: {e}")
+            return {bot_id: {} for bot_id in bot_ids}
+        
+        with ThreadPoolExecutor(max_workers=len(bot_ids)) as pool:
+            return dict(zip(bot_ids, pool.map(self.get_bot_metrics, bot_ids)))
+
+    def list_markets(
+        self,
+        active: bool = True,
+        min_liquidity: Optional[float] = None,
+        limit: int = 100,
+    ) -> List[Dict[str, Any]]:
+        """List markets.
+        
+        Args:
+            active: Only unresolved markets
+            min_liquidity: Minimum liquidity filter
+            limit: Maximum results
+        
+        Returns:
+            List of market dictionaries
+        
+        Raises:
+            requests.HTTPError: If the API request fails
+        """
+        params: Dict[str, Any] = {"active": active, "limit": limit}
+        if min_liquidity is not None:
+            params["min_liquidity"] = min_liquidity
+        
+        response = self.session.get(f"{self.base_url}/api/v1/markets", params=params)
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def get_risk_metrics(self, bot_id: Optional[int] = None) -> Dict[str, Any]:
+        """Get risk metrics for a bot or the whole portfolio.
+        
+        Args:
+            bot_id: Bot ID (None for portfolio)
+        
+        Returns:
+            Risk metrics dictionary, including ``zone_exposures``
+        """
+        try:
+            response = self.session.get(
+                f"{self.base_url}/api/v1/risk/metrics",
+                params={"bot_id": bot_id} if bot_id else None,
+            )
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except Exception as e:
+            logger.error(f"Failed to fetch risk metrics: {e}")
+            return {}
+
+    def get_paper_summary(self) -> Dict[str, Any]:
+        """Get paper wallet, metrics and positions in one request.
+        
+        Returns:
+            Dict with ``wallet``, ``metrics`` and ``positions`` keys
+        """
+        response = self.session.get(f"{self.base_url}/api/v1/paper/summary")
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def reset_paper_wallet(self, initial_balance: float = 10000) -> Dict[str, Any]:
+        """Reset the paper wallet and clear its positions.
+        
+        Args:
+            initial_balance: Starting balance of the new wallet
+        
+        Returns:
+            New wallet data with a ``message``
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/v1/paper/wallet/reset",
+            params={"initial_balance": initial_balance},
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def run_backtest(
+        self,
+        start_date: str,
+        end_date: str,
+        initial_balance: float,
+        parameters: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Run a backtest on historical data.
+        
+        Args:
+            start_date: ISO start date
+            end_date: ISO end date
+            initial_balance: Starting capital
+            parameters: Strategy parameters override
+        
+        Returns:
+            Backtest result summary
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/v1/backtesting/run",
+            params={
+                "start_date": start_date,
+                "end_date": end_date,
+                "initial_balance": initial_balance,
+            },
+            json=parameters,
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def list_bots(self) -> List[Dict[str, Any]]:
+        """Get list of all bots, coalescing concurrent callers.
+        
+        Returns:
+            List of bot dictionaries
+        """
+        return self._bot_list_loader.load("bots").result()
+
+    def create_bot(
+        self,
+        strategy_type: str,
+        config: Dict[str, Any],
+        capital_allocated: float,
+    ) -> Dict[str, Any]:
+        """Create a new bot.
+        
+        Args:
+            strategy_type: Strategy identifier
+            config: Strategy configuration
+            capital_allocated: Capital allocated to the bot
+        
+        Returns:
+            Created bot dictionary
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/v1/bots",
+            json={
+                "strategy_type": strategy_type,
+                "config": config,
+                "capital_allocated": capital_allocated,
+            },
+        )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    def update_bot_state(self, bot_id: int, state: str) -> Dict[str, Any]:
+        """Change bot state, batched with other sessions' bot operations.
+        
+        The call blocks until its batch completes, so one session's
+        operations never share a batch; only concurrent sessions do.
+        
+        Args:
+            bot_id: Bot ID
+            state: Target state
+        
+        Returns:
+            Operation result
+        """
+        return self._bot_op_loader.load((bot_id, "update_state", state)).result()
+
+    def delete_bot(self, bot_id: int) -> Dict[str, Any]:
+        """Delete bot, batched with other sessions' bot operations.
+        
+        Args:
+            bot_id: Bot ID
+        
+        Returns:
+            Operation result
+        
+        Raises:
+            NotImplementedError: If the API has no batch endpoint; there is
+                no per-bot delete route to fall back to
+        """
+        return self._bot_op_loader.load((bot_id, "delete", None)).result()
+
     def emergency_halt(self) -> Dict[str, str]:
         """Trigger emergency halt for all bots.
         
@@ -95,11 +390,77 @@ class APIClient:
                 f"{self.base_url}/api/v1/risk/emergency-halt"
             )
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except Exception as e:
             logger.error(f"Failed to trigger emergency halt: {e}")
             return {"status": "error", "message": str(e)}
 
+    def _fetch_bot_lists(self, keys: List[Hashable]) -> List[Any]:
+        """Batch function for ``list_bots``: one GET answers every caller.
+        
+        Args:
+            keys: Pending keys
+        
+        Returns:
+            Bot list for each key
+        """
+        response = self.session.get(f"{self.base_url}/api/v1/bots")
+        response.raise_for_status()
+        bots = orjson.loads(response.content)
+        return [bots] * len(keys)
+
+    def _run_bot_ops(self, keys: List[Hashable]) -> List[Any]:
+        """Batch function for bot operations via ``/bots/batch``.
+        
+        Falls back to concurrent per-bot requests when the API has no batch
+        endpoint (404, or 405 from the ``GET /bots/{bot_id}`` route).
+        
+        Args:
+            keys: ``(bot_id, op, value)`` tuples
+        
+        Returns:
+            Operation results in key order; a failed operation's exception
+            takes its place
+        """
+        response = self.session.post(
+            f"{self.base_url}/api/v1/bots/batch",
+            json={
+                "operations": [
+                    {"bot_id": bot_id, "op": op, "value": value}
+                    for bot_id, op, value in keys
+                ],
+            },
+        )
+        if response.status_code not in NO_BATCH_STATUSES:
+            response.raise_for_status()
+            return orjson.loads(response.content)["results"]
+        
+        with ThreadPoolExecutor(max_workers=len(keys)) as pool:
+            return list(pool.map(self._run_bot_op, keys))
+
+    def _run_bot_op(self, key: Hashable) -> Any:
+        """Run one bot operation through the per-bot routes.
+        
+        Args:
+            key: ``(bot_id, op, value)`` tuple
+        
+        Returns:
+            Operation result, or the exception it raised
+        """
+        bot_id, op, value = key
+        
+        try:
+            if op == "delete":
+                raise NotImplementedError("The API has no per-bot delete route")
+            action = BOT_STATE_ACTIONS.get(value)
+            if action is None:
+                raise ValueError(f"Unsupported bot state: {value}")
+            response = self.session.post(f"{self.base_url}/api/v1/bots/{bot_id}/{action}")
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except Exception as e:
+            return e
+
     def _get_default_metrics(self) -> Dict[str, Any]:
         """Get default metrics when API unavailable.
         
@@ -0,0 +1,56 @@
+"""Bot grid component.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+from html import escape
+from typing import Any, Dict, List
+
+import streamlit as st
+
+from src.presentation.dashboard.components.status_badge import bot_status_badge_html
+from src.presentation.dashboard.utils import format_currency, format_percentage
+
+# Grid action -> button label
+BOT_ACTIONS = {
+    "start": "▶️",
+    "pause": "⏸️",
+    "stop": "⏹️",
+}
+
+_GRID_STYLE = """
+<style>
+.pets-bot-grid {display:grid;grid-template-columns:repeat(4,1fr);gap:12px}
+.pets-bot-card {border:1px solid rgba(128,128,128,.3);border-radius:8px;padding:12px}
+.pets-bot-card h4 {margin:0 0 4px}
+</style>
+"""
+
+
+def render_bot_grid(bots: List[Dict[str, Any]]) -> None:
+    """Render all bot cards as one HTML block.
+    
+    The grid is display-only, so it costs one element instead of several
+    widgets per bot; pages drive state changes from ``st.button`` widgets
+    labelled with ``BOT_ACTIONS``.
+    
+    Args:
+        bots: Bot dictionaries from the API
+    """
+    cards = []
+    
+    for bot in bots:
+        bot_id = escape(str(bot.get("bot_id", "N/A")))
+        cards.append(
+            f'<div class="pets-bot-card">'
+            f'<h4>Bot {bot_id}</h4>'
+            f'<p><b>Strategy</b>: {escape(str(bot.get("strategy_type", "N/A")))}</p>'
+            f'{bot_status_badge_html(escape(str(bot.get("state", "IDLE"))))}'
+            f'<p>Capital: {format_currency(bot.get("capital_allocated", 0))}<br>'
+            f'P&amp;L: {format_currency(bot.get("total_pnl", 0))} '
+            f'({format_percentage(bot.get("roi", 0))})</p>'
+            f'</div>'
+        )
+    
+    st.html(f'{_GRID_STYLE}<div class="pets-bot-grid">{"".join(cards)}</div>')
@@ -4,22 +4,45 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
+import numpy as np
 import plotly.graph_objects as go
-from typing import Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Any, Mapping
 
+# Series longer than this are drawn with WebGL (Scattergl)
+WEBGL_THRESHOLD = 2000
 
-def get_default_layout() -> Dict[str, Any]:
+
+@lru_cache(maxsize=1)
+def get_default_layout() -> Mapping[str, Any]:
     """Get default Plotly layout configuration.
     
+    The layout is built once and returned as a read-only view; merge it
+    with per-chart overrides (``{**get_default_layout(), "title": ...}``)
+    instead of mutating it.
+    
     Returns:
-        Layout dictionary
+        Read-only layout mapping
     """
-    return {
+    return MappingProxyType({
         "template": "plotly_white",
         "margin": dict(l=20, r=20, t=40, b=20),
         "height": 400,
         "hovermode": "x unified",
-    }
+    })
+
+
+def scatter_type(n_points: int) -> type:
+    """Scatter trace class for a series: WebGL above ``WEBGL_THRESHOLD``.
+    
+    Args:
+        n_points: Number of points in the series
+    
+    Returns:
+        ``go.Scattergl`` for long series, ``go.Scatter`` (SVG) otherwise
+    """
+    return go.Scattergl if n_points > WEBGL_THRESHOLD else go.Scatter
 
 
 def create_line_chart(
@@ -38,13 +61,17 @@ def create_line_chart(
         x_label: X-axis label
         y_label: Y-axis label
     
+    Long series (more than ``WEBGL_THRESHOLD`` points) are rendered
+    with WebGL.
+    
     Returns:
         Plotly figure
     """
-    fig = go.Figure()
+    scatter = scatter_type(len(x))
     
+    fig = go.Figure()
     fig.add_trace(
-        go.Scatter(
+        scatter(
             x=x,
             y=y,
             mode="lines",
@@ -53,15 +80,13 @@ def create_line_chart(
         )
     )
     
-    layout = get_default_layout()
-    layout.update({
+    fig.update_layout({
+        **get_default_layout(),
         "title": title,
         "xaxis_title": x_label,
         "yaxis_title": y_label,
     })
     
-    fig.update_layout(**layout)
-    
     return fig
 
 
@@ -90,10 +115,7 @@ def create_pie_chart(
         ]
     )
     
-    layout = get_default_layout()
-    layout.update({"title": title})
-    
-    fig.update_layout(**layout)
+    fig.update_layout({**get_default_layout(), "title": title})
     
     return fig
 
@@ -124,9 +146,92 @@ def create_heatmap(
         )
     )
     
-    layout = get_default_layout()
-    layout.update({"title": title})
+    fig.update_layout({**get_default_layout(), "title": title})
+    
+    return fig
+
+
+def create_latency_histogram(
+    latencies: np.ndarray,
+    edges: List[float],
+    labels: List[str],
+    title: str,
+) -> go.Figure:
+    """Create a bucketed latency bar chart marking the p99 bucket.
     
-    fig.update_layout(**layout)
+    The bucket axis is categorical, so the p99 marker is drawn as a shape
+    at the bucket's category index with a separate annotation.
+    
+    Args:
+        latencies: Non-empty latency samples (ms)
+        edges: Bucket edges, one more than ``labels``
+        labels: Bucket labels
+        title: Chart title
+    
+    Returns:
+        Plotly figure
+    """
+    counts, _ = np.histogram(latencies, bins=edges)
+    
+    fig = go.Figure(data=[go.Bar(x=labels, y=counts.tolist(), marker_color="#3b82f6")])
+    
+    p99 = float(np.percentile(latencies, 99))
+    p99_bucket = min(int(np.searchsorted(edges, p99, side="right")) - 1, len(labels) - 1)
+    fig.add_shape(
+        type="line",
+        xref="x",
+        yref="paper",
+        x0=p99_bucket,
+        x1=p99_bucket,
+        y0=0,
+        y1=1,
+        line=dict(color="#ef4444", dash="dash"),
+    )
+    fig.add_annotation(
+        x=p99_bucket,
+        y=1,
+        xref="x",
+        yref="paper",
+        text=f"p99 {p99:.0f}ms",
+        showarrow=False,
+        yanchor="bottom",
+    )
+    
+    fig.update_layout(
+        title=title,
+        xaxis_title="Latency Bucket",
+        yaxis_title="Order Count",
+        height=300,
+    )
+    
+    return fig
+
+
+def roll_line_chart(fig: go.Figure, x_value: Any, y_value: Any) -> go.Figure:
+    """Advance a line chart in place at its own resolution.
+    
+    The spacing of the last two points is the chart's step. Once
+    ``x_value`` is a full step past the newest point, the window slides:
+    the oldest point is dropped and a point one step later is appended.
+    Otherwise the newest point's value is updated, so refreshing faster
+    than the step never compresses the window.
+    
+    Args:
+        fig: Figure created by ``create_line_chart`` with at least two points
+        x_value: Current X value (same type as the chart's X values)
+        y_value: Current Y value
+    
+    Returns:
+        The same figure, updated
+    """
+    trace = fig.data[0]
+    xs, ys = tuple(trace.x), tuple(trace.y)
+    step = xs[-1] - xs[-2]
+    
+    if x_value - xs[-1] >= step:
+        trace.x = xs[1:] + (xs[-1] + step,)
+        trace.y = ys[1:] + (y_value,)
+    else:
+        trace.y = ys[:-1] + (y_value,)
     
     return fig
@@ -3,6 +3,8 @@
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from src.presentation.dashboard.components.chart_utils import scatter_type
+
 
 def create_equity_curve(data: list[dict]) -> go.Figure:
     """Create equity curve chart.
@@ -16,7 +18,7 @@ def create_equity_curve(data: list[dict]) -> go.Figure:
     fig = go.Figure()
 
     fig.add_trace(
-        go.Scatter(
+        scatter_type(len(data))(
             x=[d["date"] for d in data],
             y=[d["value"] for d in data],
             mode="lines+markers",
@@ -7,11 +7,14 @@ Created: 2026-02-13
 import streamlit as st
 
 
-def bot_status_badge(state: str) -> None:
-    """Render bot status badge.
+def bot_status_badge_html(state: str) -> str:
+    """Build bot status badge markup.
     
     Args:
         state: Bot state (IDLE, RUNNING, PAUSED, ERROR)
+    
+    Returns:
+        Badge ``<span>`` HTML
     """
     colors = {
         "IDLE": "gray",
@@ -21,14 +24,22 @@ def bot_status_badge(state: str) -> None:
     }
     
     color = colors.get(state, "gray")
-    st.markdown(
+    return (
         f'<span style="background-color:{color};color:white;'
         f'padding:4px 8px;border-radius:4px;font-size:12px;'
-        f'font-weight:bold">{state}</span>',
-        unsafe_allow_html=True,
+        f'font-weight:bold">{state}</span>'
     )
 
 
+def bot_status_badge(state: str) -> None:
+    """Render bot status badge.
+    
+    Args:
+        state: Bot state (IDLE, RUNNING, PAUSED, ERROR)
+    """
+    st.markdown(bot_status_badge_html(state), unsafe_allow_html=True)
+
+
 def zone_badge(zone: int) -> None:
     """Render risk zone badge.
     
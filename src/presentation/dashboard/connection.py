@@ -0,0 +1,145 @@
+"""Streamlit connection for the PETS API.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import asyncio
+import atexit
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, List, TypeVar
+
+import httpx
+from streamlit.connections import BaseConnection
+
+from src.presentation.dashboard.api_client import APIClient
+
+T = TypeVar("T")
+
+
+class PETSConnection(BaseConnection[APIClient]):
+    """Shared connection to the PETS API.
+    
+    The async ``APIClient`` runs on one event loop owned by a daemon thread
+    for the lifetime of the connection, so its keep-alive pool survives
+    reruns instead of being rebuilt by ``asyncio.run`` on every page render.
+    Coroutine methods of the client are exposed as blocking calls.
+    
+    Examples:
+        >>> conn = st.connection("pets_api", type=PETSConnection)
+        >>> bots = conn.list_bots()["bots"]
+    """
+
+    def _connect(self, **kwargs: Any) -> APIClient:
+        """Start the event loop thread and create the API client.
+        
+        Args:
+            **kwargs: ``base_url`` and ``api_key`` overrides
+        
+        Returns:
+            API client bound to the connection's loop
+        """
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(
+            target=self._loop.run_forever,
+            name=f"{self._connection_name}-loop",
+            daemon=True,
+        ).start()
+        
+        client = APIClient(
+            base_url=kwargs.get("base_url", "http://localhost:8000"),
+            api_key=kwargs.get("api_key", ""),
+            limits=httpx.Limits(
+                max_connections=32,
+                max_keepalive_connections=16,
+                keepalive_expiry=60,
+            ),
+        )
+        atexit.register(self._close, client, self._loop)
+        
+        return client
+
+    @staticmethod
+    def _close(client: APIClient, loop: asyncio.AbstractEventLoop) -> None:
+        """Close the client's pooled connections and stop its loop.
+        
+        Args:
+            client: Client created by ``_connect``
+            loop: Loop the client runs on
+        """
+        try:
+            asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=5)
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+
+    @property
+    def client(self) -> APIClient:
+        """Underlying async API client, for building coroutines to gather."""
+        return self._instance
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run coroutine on the connection's loop and wait for it.
+        
+        Args:
+            coro: Coroutine to run
+        
+        Returns:
+            Coroutine result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> Future[T]:
+        """Schedule a long-running coroutine on the loop without waiting.
+        
+        Args:
+            coro: Coroutine to run, e.g. a WebSocket feed
+        
+        Returns:
+            Future for the coroutine's result
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def gather(
+        self,
+        *coros: Coroutine[Any, Any, Any],
+        return_exceptions: bool = False,
+    ) -> List[Any]:
+        """Run coroutines concurrently on the connection's loop.
+        
+        Args:
+            *coros: Coroutines, usually from ``client`` methods
+            return_exceptions: Return exceptions in place of results
+                instead of raising the first one
+        
+        Returns:
+            Results in argument order
+        """
+        async def run_all() -> List[Any]:
+            return list(
+                await asyncio.gather(*coros, return_exceptions=return_exceptions)
+            )
+        
+        return self.run(run_all())
+
+    def __getattr__(self, name: str) -> Any:
+        """Expose client methods, wrapping coroutines as blocking calls.
+        
+        Args:
+            name: Attribute name
+        
+        Returns:
+            Client attribute or blocking wrapper
+        """
+        if name.startswith("_"):
+            raise AttributeError(name)
+        
+        attr = getattr(self._instance, name)
+        
+        if not asyncio.iscoroutinefunction(attr):
+            return attr
+        
+        def call(*args: Any, **kwargs: Any) -> Any:
+            return self.run(attr(*args, **kwargs))
+        
+        return call
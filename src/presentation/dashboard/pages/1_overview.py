@@ -1,21 +1,21 @@
 """Overview page - Portfolio summary."""
 
+import time
+
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 
 st.set_page_config(page_title="Overview", page_icon="📊", layout="wide")
 
 st.title("📊 Portfolio Overview")
 
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
 
 # Auto-refresh
 auto_refresh = st.session_state.get("auto_refresh", True)
 if auto_refresh:
-    import time
     time.sleep(30)  # Refresh every 30s
     st.rerun()
 
@@ -5,20 +5,16 @@ Created: 2026-02-13
 """
 
 import streamlit as st
-import time
 from datetime import datetime, timedelta
-import random
 
+import numpy as np
+
+from src.presentation.dashboard._client import get_api_client, get_portfolio_metrics_cached
 from src.presentation.dashboard.components import (
-    APIClient,
     render_metric_card,
     StateManager,
 )
-from src.presentation.dashboard.components.chart_utils import (
-    create_line_chart,
-    create_pie_chart,
-    create_heatmap,
-)
+from src.presentation.dashboard.utils import DEMO
 
 # Page config
 st.set_page_config(
@@ -30,10 +26,11 @@ st.set_page_config(
 # Initialize state
 state = StateManager()
 
-if not state.has("api_client"):
-    state.set("api_client", APIClient(base_url="http://localhost:8000"))
+api_client = get_api_client()
 
-api_client = state.get("api_client")
+# One generator per session for all sample data
+rng = state.get("rng") or np.random.default_rng()
+state.set("rng", rng)
 
 # Header
 st.title("📊 Portfolio Overview")
@@ -62,82 +59,119 @@ with col3:
 
 st.markdown("---")
 
-# Metrics cards (1s updates)
-st.markdown("### 📈 Key Metrics")
-
-# Fetch metrics
-metrics = api_client.get_portfolio_metrics()
-
-col1, col2, col3, col4 = st.columns(4)
+# Each section refreshes on its own fragment cadence so a tick never
+# re-renders the whole page at once. Chart helpers (and Plotly behind
+# them) are imported inside the fragments that draw them.
 
-with col1:
-    render_metric_card(
-        "Portfolio Value",
-        f"${metrics.get('portfolio_value', 0):,.2f}",
-        f"+${random.uniform(10, 100):.2f}",
-        "normal",
-    )
-
-with col2:
-    pnl = metrics.get("total_pnl", 0)
-    render_metric_card(
-        "Total P&L",
-        f"${pnl:+,.2f}",
-        f"{(pnl / 5000 * 100):+.2f}%" if pnl != 0 else "0%",
-        "normal" if pnl >= 0 else "inverse",
-    )
 
-with col3:
-    render_metric_card(
-        "Open Positions",
-        str(metrics.get("open_positions", 0)),
-        None,
-        "off",
-    )
-
-with col4:
-    render_metric_card(
-        "Active Bots",
-        f"{metrics.get('active_bots', 0)}/10",
-        None,
-        "off",
+@st.fragment(run_every="1s")
+def render_key_metrics() -> None:
+    """Render portfolio metric cards (1s updates)."""
+    metrics = get_portfolio_metrics_cached(api_client.base_url, api_client)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        render_metric_card(
+            "Portfolio Value",
+            f"${metrics.get('portfolio_value', 0):,.2f}",
+            f"+${rng.uniform(10, 100):.2f}" if DEMO else None,
+            "normal",
+        )
+    
+    with col2:
+        pnl = metrics.get("total_pnl", 0)
+        render_metric_card(
+            "Total P&L",
+            f"${pnl:+,.2f}",
+            f"{(pnl / 5000 * 100):+.2f}%" if pnl != 0 else "0%",
+            "normal" if pnl >= 0 else "inverse",
+        )
+    
+    with col3:
+        render_metric_card(
+            "Open Positions",
+            str(metrics.get("open_positions", 0)),
+            None,
+            "off",
+        )
+    
+    with col4:
+        render_metric_card(
+            "Active Bots",
+            f"{metrics.get('active_bots', 0)}/10",
+            None,
+            "off",
+        )
+
+
+@st.fragment(run_every="2s")
+def render_pnl_chart() -> None:
+    """Render cumulative P&L line chart (2s updates)."""
+    from src.presentation.dashboard.components.chart_utils import (
+        create_line_chart,
+        roll_line_chart,
     )
-
-st.markdown("---")
-
-# Charts
-col1, col2 = st.columns(2)
-
-with col1:
-    st.markdown("### 📊 Cumulative P&L")
     
-    # Generate sample data
     now = datetime.now()
-    x = [now - timedelta(hours=i) for i in range(24, 0, -1)]
-    y = [random.uniform(-100, 500) for _ in range(24)]
-    
-    fig = create_line_chart(
-        x=x,
-        y=y,
-        title="24h P&L Trend",
-        x_label="Time",
-        y_label="P&L ($)",
-    )
     
-    st.plotly_chart(fig, use_container_width=True)
-
-with col2:
-    st.markdown("### 🥧 Portfolio Composition")
+    if not DEMO:
+        # No P&L history endpoint: chart the samples seen this session
+        metrics = get_portfolio_metrics_cached(api_client.base_url, api_client)
+        history = state.get("pnl_history") or []
+        history = (history + [(now, metrics.get("total_pnl", 0))])[-24:]
+        state.set("pnl_history", history)
+        
+        x, y = zip(*history)
+        fig = create_line_chart(
+            x=list(x),
+            y=list(y),
+            title="Session P&L Trend",
+            x_label="Time",
+            y_label="P&L ($)",
+        )
+        st.plotly_chart(fig, use_container_width=True, key="pnl_chart")
+        return
     
-    # Generate sample data
-    bots = api_client.get_bot_list()
+    fig = state.get("pnl_fig")
     
-    if bots:
-        labels = [f"Bot {b.get('bot_id', i+1)}" for i, b in enumerate(bots[:8])]
-        values = [random.uniform(500, 2000) for _ in labels]
+    if fig is None:
+        # Generate sample data
+        x = [now - timedelta(hours=i) for i in range(24, 0, -1)]
+        y = rng.uniform(-100, 500, 24)
+        
+        fig = create_line_chart(
+            x=x,
+            y=y,
+            title="24h P&L Trend",
+            x_label="Time",
+            y_label="P&L ($)",
+        )
     else:
+        # Only the newest point changes between refreshes
+        roll_line_chart(fig, now, rng.uniform(-100, 500))
+    
+    state.set("pnl_fig", fig)
+    
+    st.plotly_chart(fig, use_container_width=True, key="pnl_chart")
+
+
+@st.fragment(run_every="5s")
+def render_composition() -> None:
+    """Render capital allocation pie chart (5s updates)."""
+    from src.presentation.dashboard.components.chart_utils import create_pie_chart
+    
+    if DEMO:
         labels = [f"Bot {i+1}" for i in range(8)]
-        values = [random.uniform(500, 2000) for _ in labels]
+        values = rng.uniform(500, 2000, len(labels))
+    else:
+        bots = api_client.get_bot_list()[:8]
+        labels = [f"Bot {b.get('bot_id', i+1)}" for i, b in enumerate(bots)]
+        values = [float(b.get("capital_allocated", 0)) for b in bots]
+    
+    if not labels:
+        st.info("No bots available. Check API connection.")
+        return
     
     fig = create_pie_chart(
         labels=labels,
@@ -147,48 +181,98 @@ with col2:
     
     st.plotly_chart(fig, use_container_width=True)
 
-# Zone heatmap
-st.markdown("### 🗺️ Zone Exposure Heatmap")
 
-# Generate sample data
-zones = ["Z1", "Z2", "Z3", "Z4", "Z5"]
-bots_sample = [f"Bot {i+1}" for i in range(8)]
-z_data = [[random.uniform(0, 100) for _ in zones] for _ in bots_sample]
+@st.fragment(run_every="10s")
+def render_zone_heatmap() -> None:
+    """Render zone exposure heatmap (10s updates)."""
+    from src.presentation.dashboard.components.chart_utils import create_heatmap
+    
+    zones = ["Z1", "Z2", "Z3", "Z4", "Z5"]
+    
+    if DEMO:
+        row_labels = [f"Bot {i+1}" for i in range(8)]
+        z_data = rng.uniform(0, 100, (len(row_labels), len(zones)))
+    else:
+        # One portfolio-level request instead of one per bot
+        exposure = api_client.get_risk_metrics().get("zone_exposures")
+        if not exposure:
+            st.info("No zone exposure available. Check API connection.")
+            return
+        
+        row_labels = ["Portfolio"]
+        z_data = [
+            [
+                float(exposure.get(zone, exposure.get(zone[1:], 0)))
+                for zone in zones
+            ]
+        ]
+    
+    fig = create_heatmap(
+        z=z_data,
+        x=zones,
+        y=row_labels,
+        title="Exposure by Zone (%)",
+    )
+    
+    st.plotly_chart(fig, use_container_width=True)
+
 
-fig = create_heatmap(
-    z=z_data,
-    x=zones,
-    y=bots_sample,
-    title="Exposure by Bot and Zone (%)",
-)
+@st.fragment(run_every="2s")
+def render_bot_grid() -> None:
+    """Render bot status table (2s updates)."""
+    bots = api_client.get_bot_list()
+    
+    if bots:
+        # Display as table, formatted client-side
+        bot_data = [
+            {
+                "Bot ID": bot.get("bot_id", "N/A"),
+                "Status": bot.get("state", "UNKNOWN"),
+                "P&L": bot.get("pnl", 0),
+                "Positions": bot.get("open_positions", 0),
+                "Win Rate": bot.get("win_rate", 0),
+            }
+            for bot in bots[:10]
+        ]
+        
+        st.dataframe(
+            bot_data,
+            column_config={
+                "P&L": st.column_config.NumberColumn(format="$%+.2f"),
+                "Win Rate": st.column_config.NumberColumn(format="%.1f%%"),
+            },
+            use_container_width=True,
+        )
+    else:
+        st.info("No bots available. Check API connection.")
+    
+    st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+
+
+# Metrics cards
+st.markdown("### 📈 Key Metrics")
+render_key_metrics()
+
+st.markdown("---")
+
+# Charts
+col1, col2 = st.columns(2)
 
-st.plotly_chart(fig, use_container_width=True)
+with col1:
+    st.markdown("### 📊 Cumulative P&L")
+    render_pnl_chart()
+
+with col2:
+    st.markdown("### 🥧 Portfolio Composition")
+    render_composition()
+
+# Zone heatmap
+st.markdown("### 🗺️ Zone Exposure Heatmap")
+render_zone_heatmap()
 
 # Bot status grid
 st.markdown("### 🤖 Bot Status Grid")
+render_bot_grid()
 
-bots = api_client.get_bot_list()
-
-if bots:
-    # Display as table
-    bot_data = []
-    for bot in bots[:10]:
-        bot_data.append({
-            "Bot ID": bot.get("bot_id", "N/A"),
-            "Status": bot.get("state", "UNKNOWN"),
-            "P&L": f"${bot.get('pnl', 0):+,.2f}",
-            "Positions": bot.get("open_positions", 0),
-            "Win Rate": f"{bot.get('win_rate', 0):.1f}%",
-        })
-    
-    st.dataframe(bot_data, use_container_width=True)
-else:
-    st.info("No bots available. Check API connection.")
-
-# Auto-refresh indicator
 st.markdown("---")
-st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Auto-refresh: 1s")
-
-# Auto-refresh (1s)
-time.sleep(1)
-st.rerun()
+st.caption("Auto-refresh: metrics 1s | P&L and bots 2s | composition 5s | heatmap 10s")
@@ -2,15 +2,14 @@
 
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 
 st.set_page_config(page_title="Bot Management", page_icon="🤖", layout="wide")
 
 st.title("🤖 Bot Management")
 
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
 
 # Fetch bots
 try:
@@ -4,12 +4,12 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
-import asyncio
-
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
-from src.presentation.dashboard.api_client import APIClient
+from src.presentation.dashboard._client import get_connection, get_portfolio_metrics_cached
+from src.presentation.dashboard.api_client import BOT_SCHEMA
 from src.presentation.dashboard.utils import format_currency, format_percentage
 
 st.set_page_config(page_title="Performance", page_icon="📈", layout="wide")
@@ -17,49 +17,43 @@ st.set_page_config(page_title="Performance", page_icon="📈", layout="wide")
 st.title("📈 Performance Analysis")
 
 # Initialize API client
-if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
-
-api_client = st.session_state.api_client
+api_client = get_connection()
 
 
-async def load_bots():
-    """Load bots list."""
+def load_bots() -> pa.Table:
+    """Load bots table."""
     try:
-        result = await api_client.list_bots()
-        return result.get("bots", [])
+        return api_client.list_bots_arrow()
     except Exception as e:
         st.error(f"Error loading bots: {e}")
-        return []
+        return BOT_SCHEMA.empty_table()
 
 
-bots = asyncio.run(load_bots())
+bots = load_bots()
 
-if not bots:
+if bots.num_rows == 0:
     st.info("No bots to analyze.")
 else:
     # Comparative table
     st.subheader("Bot Comparison")
     
-    df_data = []
-    for bot in bots:
-        df_data.append({
-            "Bot ID": bot.get("bot_id"),
-            "Strategy": bot.get("strategy_type"),
-            "State": bot.get("state"),
-            "Capital": bot.get("capital_allocated", 0),
-            "P&L": bot.get("total_pnl", 0),
-            "ROI": bot.get("roi", 0),
-        })
-    
-    df = pd.DataFrame(df_data)
+    table = pa.table({
+        "Bot ID": bots["bot_id"],
+        "Strategy": bots["strategy_type"],
+        "State": bots["state"],
+        "Capital": pc.fill_null(bots["capital_allocated"], 0.0),
+        "P&L": pc.fill_null(bots["total_pnl"], 0.0),
+        "ROI": pc.multiply(pc.fill_null(bots["roi"], 0.0), 100),
+    })
     
+    # Arrow goes straight to the frontend; formatting happens client-side
     st.dataframe(
-        df.style.format({
-            "Capital": "${:,.2f}",
-            "P&L": "${:,.2f}",
-            "ROI": "{:.2%}",
-        }),
+        table,
+        column_config={
+            "Capital": st.column_config.NumberColumn(format="$%.2f"),
+            "P&L": st.column_config.NumberColumn(format="$%.2f"),
+            "ROI": st.column_config.NumberColumn(format="%.2f%%"),
+        },
         use_container_width=True,
     )
     
@@ -68,15 +62,15 @@ else:
     # Portfolio metrics
     st.subheader("Portfolio Overview")
     
-    async def load_portfolio():
+    def load_portfolio():
         """Load portfolio metrics."""
         try:
-            return await api_client.get_portfolio_metrics()
+            return get_portfolio_metrics_cached(api_client.base_url, api_client)
         except Exception as e:
             st.error(f"Error loading portfolio: {e}")
             return {}
     
-    portfolio = asyncio.run(load_portfolio())
+    portfolio = load_portfolio()
     
     col1, col2, col3, col4 = st.columns(4)
     
@@ -6,14 +6,28 @@ Created: 2026-02-13
 
 import streamlit as st
 import time
-from datetime import datetime
-import random
+from datetime import datetime, timedelta
+from itertools import cycle
 
+import numpy as np
+
+from src.presentation.dashboard._client import get_api_client
 from src.presentation.dashboard.components import (
-    APIClient,
     StateManager,
 )
-from src.presentation.dashboard.components.chart_utils import create_line_chart
+from src.presentation.dashboard.components.chart_utils import (
+    create_line_chart,
+    roll_line_chart,
+)
+from src.presentation.dashboard.utils import DEMO
+
+# Bot state -> status emoji
+_STATE_EMOJI = {
+    "ACTIVE": "🟢",
+    "PAUSED": "🟡",
+    "STOPPED": "🔴",
+    "ERROR": "⚠️",
+}
 
 # Page config
 st.set_page_config(
@@ -25,10 +39,124 @@ st.set_page_config(
 # Initialize state
 state = StateManager()
 
-if not state.has("api_client"):
-    state.set("api_client", APIClient(base_url="http://localhost:8000"))
+api_client = get_api_client()
+
+# One generator per session for all sample data
+rng = state.get("rng") or np.random.default_rng()
+state.set("rng", rng)
+
+
+@st.cache_data(ttl=60)
+def hour_axis(now_hour: int) -> list:
+    """Hourly timestamps for the last 24h, keyed on the hour bucket.
+    
+    Args:
+        now_hour: Current hour as hours since the epoch
+    
+    Returns:
+        24 datetimes ending one hour before ``now_hour``
+    """
+    end = datetime.fromtimestamp(now_hour * 3600)
+    return [end - timedelta(hours=i) for i in range(24, 0, -1)]
+
+
+@st.cache_data(ttl=2)
+def render_config_yaml(bot_id: int) -> str:
+    """Render sample YAML configuration for a bot.
+    
+    Args:
+        bot_id: Bot ID
+    
+    Returns:
+        YAML text
+    """
+    return f"""# Bot {bot_id} Configuration
+strategy_type: Strategy_{bot_id}
+capital_allocated: 5000.0
+max_positions: 5
+kelly_fraction: 0.5  # Half Kelly
+zone_restriction: [1, 2, 3]
+
+risk:
+  max_drawdown: 0.25
+  consecutive_loss_limit: 3
+  daily_loss_limit: 0.05
+"""
+
+
+@st.cache_data(ttl=2)
+def render_logs(bot_id: int) -> str:
+    """Render sample log lines for a bot.
+    
+    Args:
+        bot_id: Bot ID
+    
+    Returns:
+        Newline-joined log text
+    """
+    now = datetime.now().strftime("%H:%M:%S")
+    return "\n".join([
+        f"{now} - INFO - Bot {bot_id} cycle executed",
+        f"{now} - INFO - Market scan completed: 15 opportunities",
+        f"{now} - DEBUG - Risk validation passed",
+        f"{now} - INFO - Order placed: market_abc123",
+        f"{now} - INFO - Position opened: pos_xyz789",
+    ])
+
+
+@st.fragment(run_every="2s")
+def render_performance_charts(selected_bot_id: int) -> None:
+    """Render the ROI and position charts for a bot (2s updates).
+    
+    Args:
+        selected_bot_id: Bot whose charts to render
+    """
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # ROI trend
+        now = datetime.now()
+        x = hour_axis(int(time.time() // 3600))
+        fig = state.get(f"roi_fig_{selected_bot_id}")
+        
+        if fig is None:
+            y = rng.uniform(-5, 15, 24)
+            
+            fig = create_line_chart(
+                x=x,
+                y=y,
+                title="24h ROI Trend",
+                x_label="Time",
+                y_label="ROI (%)",
+            )
+        else:
+            roll_line_chart(fig, now, rng.uniform(-5, 15))
+        
+        state.set(f"roi_fig_{selected_bot_id}", fig)
+        
+        st.plotly_chart(fig, use_container_width=True, key="roi_chart")
+    
+    with col2:
+        # Position count
+        fig = state.get(f"positions_fig_{selected_bot_id}")
+        
+        if fig is None:
+            y = rng.integers(0, 6, 24)
+            
+            fig = create_line_chart(
+                x=x,
+                y=y,
+                title="Position Count History",
+                x_label="Time",
+                y_label="Positions",
+            )
+        else:
+            roll_line_chart(fig, now, int(rng.integers(0, 6)))
+        
+        state.set(f"positions_fig_{selected_bot_id}", fig)
+        
+        st.plotly_chart(fig, use_container_width=True, key="positions_chart")
 
-api_client = state.get("api_client")
 
 # Header
 st.title("🤖 Bot Control Center")
@@ -38,7 +166,7 @@ st.markdown("### Select Bot")
 
 bots = api_client.get_bot_list()
 
-if not bots:
+if not bots and DEMO:
     # Generate sample bots if API unavailable
     bots = [
         {"bot_id": i+1, "strategy_type": f"Strategy_{i+1}", "state": "ACTIVE"}
@@ -53,18 +181,16 @@ with col1:
     
     selected_bot_id = state.get("selected_bot_id", 1)
     
-    for i, bot in enumerate(bots[:10]):
-        with bot_cols[i % 5]:
-            bot_id = bot.get("bot_id", i+1)
-            state_emoji = {
-                "ACTIVE": "🟢",
-                "PAUSED": "🟡",
-                "STOPPED": "🔴",
-                "ERROR": "⚠️",
-            }.get(bot.get("state", "STOPPED"), "⚪")
-            
+    bot_ids = [bot.get("bot_id", i+1) for i, bot in enumerate(bots[:10])]
+    labels = [
+        f"{_STATE_EMOJI.get(bot.get('state', 'STOPPED'), '⚪')} Bot {bot_id}"
+        for bot, bot_id in zip(bots, bot_ids)
+    ]
+    
+    for col, label, bot_id in zip(cycle(bot_cols), labels, bot_ids):
+        with col:
             if st.button(
-                f"{state_emoji} Bot {bot_id}",
+                label,
                 key=f"bot_select_{bot_id}",
                 use_container_width=True,
             ):
@@ -87,16 +213,16 @@ st.markdown(f"### Bot {selected_bot_id} Details")
 # Fetch bot metrics
 bot_metrics = api_client.get_bot_metrics(selected_bot_id)
 
-if not bot_metrics:
+if not bot_metrics and DEMO:
     # Sample data
     bot_metrics = {
         "bot_id": selected_bot_id,
         "state": "ACTIVE",
         "strategy_type": f"Strategy_{selected_bot_id}",
-        "pnl": random.uniform(-100, 500),
-        "open_positions": random.randint(0, 5),
-        "win_rate": random.uniform(45, 65),
-        "sharpe_ratio": random.uniform(0.5, 1.5),
+        "pnl": rng.uniform(-100, 500),
+        "open_positions": int(rng.integers(0, 6)),
+        "win_rate": rng.uniform(45, 65),
+        "sharpe_ratio": rng.uniform(0.5, 1.5),
     }
 
 # Metrics cards
@@ -127,56 +253,12 @@ tab1, tab2, tab3, tab4 = st.tabs(["📊 Metrics", "⚙️ Config", "🎬 Actions
 with tab1:
     st.markdown("#### Performance Charts")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # ROI trend
-        from datetime import timedelta
-        now = datetime.now()
-        x = [now - timedelta(hours=i) for i in range(24, 0, -1)]
-        y = [random.uniform(-5, 15) for _ in range(24)]
-        
-        fig = create_line_chart(
-            x=x,
-            y=y,
-            title="24h ROI Trend",
-            x_label="Time",
-            y_label="ROI (%)",
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
-    
-    with col2:
-        # Position count
-        x = [now - timedelta(hours=i) for i in range(24, 0, -1)]
-        y = [random.randint(0, 5) for _ in range(24)]
-        
-        fig = create_line_chart(
-            x=x,
-            y=y,
-            title="Position Count History",
-            x_label="Time",
-            y_label="Positions",
-        )
-        
-        st.plotly_chart(fig, use_container_width=True)
+    render_performance_charts(selected_bot_id)
 
 with tab2:
     st.markdown("#### Configuration Editor")
     
-    # Sample config
-    config_yaml = f"""# Bot {selected_bot_id} Configuration
-strategy_type: Strategy_{selected_bot_id}
-capital_allocated: 5000.0
-max_positions: 5
-kelly_fraction: 0.5  # Half Kelly
-zone_restriction: [1, 2, 3]
-
-risk:
-  max_drawdown: 0.25
-  consecutive_loss_limit: 3
-  daily_loss_limit: 0.05
-"""
+    config_yaml = render_config_yaml(selected_bot_id)
     
     edited_config = st.text_area(
         "YAML Configuration",
@@ -225,20 +307,11 @@ with tab3:
 with tab4:
     st.markdown("#### Live Logs")
     
-    # Sample logs
-    logs = [
-        f"{datetime.now().strftime('%H:%M:%S')} - INFO - Bot {selected_bot_id} cycle executed",
-        f"{datetime.now().strftime('%H:%M:%S')} - INFO - Market scan completed: 15 opportunities",
-        f"{datetime.now().strftime('%H:%M:%S')} - DEBUG - Risk validation passed",
-        f"{datetime.now().strftime('%H:%M:%S')} - INFO - Order placed: market_abc123",
-        f"{datetime.now().strftime('%H:%M:%S')} - INFO - Position opened: pos_xyz789",
-    ]
-    
     log_level = st.selectbox("Filter by level", ["ALL", "INFO", "DEBUG", "WARNING", "ERROR"])
     
     st.text_area(
         "Recent Logs (Last 50)",
-        value="\n".join(logs),
+        value=render_logs(selected_bot_id),
         height=200,
         disabled=True,
     )
@@ -248,8 +321,4 @@ with tab4:
 
 # Auto-refresh indicator
 st.markdown("---")
-st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Auto-refresh: 2s")
-
-# Auto-refresh (2s)
-time.sleep(2)
-st.rerun()
+st.caption(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} | Charts auto-refresh: 2s")
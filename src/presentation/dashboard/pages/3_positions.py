@@ -2,15 +2,14 @@
 
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 
 st.set_page_config(page_title="Positions", page_icon="💼", layout="wide")
 
 st.title("💼 Positions")
 
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
 
 # Tabs
 tab1, tab2 = st.tabs(["📈 Open Positions", "📊 Closed Positions"])
@@ -82,18 +81,28 @@ with tab2:
         st.dataframe(
             [
                 {
-                    "Market": pos["market_id"][:12] + "...",
+                    "Market": pos["market_id"],
                     "Side": pos["side"],
-                    "Size": f"${pos['size']:,.0f}",
-                    "Entry": f"{pos['entry_price']:.4f}",
-                    "Realized P&L": f"${pos['realized_pnl']:,.2f}" if pos["realized_pnl"] else "N/A",
-                    "P&L %": f"{(pos['realized_pnl']/pos['size']*100):.2f}%" if pos["realized_pnl"] and pos['size'] else "N/A",
-                    "Zone": f"Z{pos['zone']}",
-                    "Opened": pos["opened_at"][:10],
-                    "Closed": pos["closed_at"][:10] if pos["closed_at"] else "N/A",
+                    "Size": pos["size"],
+                    "Entry": pos["entry_price"],
+                    "Realized P&L": pos["realized_pnl"],
+                    "P&L %": pos["realized_pnl"] / pos["size"] * 100 if pos["realized_pnl"] and pos["size"] else None,
+                    "Zone": pos["zone"],
+                    "Opened": pos["opened_at"],
+                    "Closed": pos["closed_at"],
                 }
                 for pos in positions
             ],
+            column_config={
+                "Market": st.column_config.TextColumn(width="medium"),
+                "Size": st.column_config.NumberColumn(format="$%.0f"),
+                "Entry": st.column_config.NumberColumn(format="%.4f"),
+                "Realized P&L": st.column_config.NumberColumn(format="$%.2f"),
+                "P&L %": st.column_config.NumberColumn(format="%.2f%%"),
+                "Zone": st.column_config.NumberColumn(format="Z%d"),
+                "Opened": st.column_config.DatetimeColumn(format="YYYY-MM-DD"),
+                "Closed": st.column_config.DatetimeColumn(format="YYYY-MM-DD"),
+            },
             use_container_width=True,
         )
     else:
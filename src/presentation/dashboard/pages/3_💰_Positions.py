@@ -4,12 +4,13 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
-import asyncio
-
-import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import streamlit as st
 
-from src.presentation.dashboard.api_client import APIClient
+from src.presentation.dashboard._client import get_connection
+from src.presentation.dashboard.api_client import POSITION_SCHEMA
 from src.presentation.dashboard.components.status_badge import zone_badge
 from src.presentation.dashboard.utils import (
     format_currency,
@@ -22,10 +23,7 @@ st.set_page_config(page_title="Positions", page_icon="💰", layout="wide")
 st.title("💰 Active Positions")
 
 # Initialize API client
-if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
-
-api_client = st.session_state.api_client
+api_client = get_connection()
 
 # Filter
 bot_filter = st.selectbox(
@@ -34,38 +32,38 @@ bot_filter = st.selectbox(
 )
 
 
-async def load_positions():
-    """Load positions list."""
+def load_positions() -> pa.Table:
+    """Load positions table."""
     try:
         bot_id = None if bot_filter == "All" else int(bot_filter.split()[1])
-        result = await api_client.list_positions(bot_id=bot_id)
-        return result.get("positions", [])
+        return api_client.list_positions_arrow(bot_id=bot_id)
     except Exception as e:
         st.error(f"Error loading positions: {e}")
-        return []
+        return POSITION_SCHEMA.empty_table()
 
 
-positions = asyncio.run(load_positions())
+positions = load_positions()
 
-if not positions:
+if positions.num_rows == 0:
     st.info("No active positions.")
 else:
     # Positions table
-    df_data = []
-    for pos in positions:
-        df_data.append({
-            "Position ID": pos.get("position_id"),
-            "Bot ID": pos.get("bot_id"),
-            "Market": pos.get("market_id", "N/A")[:16] + "...",
-            "Side": pos.get("side"),
-            "Size": pos.get("size", 0),
-            "Entry": pos.get("entry_price", 0),
-            "Current": pos.get("current_price", 0),
-            "P&L": pos.get("unrealized_pnl", 0),
-            "Zone": pos.get("zone", 0),
-        })
+    market = pc.utf8_slice_codeunits(pc.fill_null(positions["market_id"], "N/A"), 0, 16)
+    
+    table = pa.table({
+        "Position ID": positions["position_id"],
+        "Bot ID": positions["bot_id"],
+        "Market": pc.binary_join_element_wise(market, "...", ""),
+        "Side": positions["side"],
+        "Size": pc.fill_null(positions["size"], 0.0),
+        "Entry": pc.fill_null(positions["entry_price"], 0.0),
+        "Current": pc.fill_null(positions["current_price"], 0.0),
+        "P&L": pc.fill_null(positions["unrealized_pnl"], 0.0),
+        "Zone": pc.fill_null(positions["zone"], 0),
+    })
     
-    df = pd.DataFrame(df_data)
+    # Styler needs pandas; the Arrow -> pandas conversion is columnar
+    df = table.to_pandas()
     
     st.dataframe(
         df.style.format({
@@ -73,8 +71,10 @@ else:
             "Entry": "{:.4f}",
             "Current": "{:.4f}",
             "P&L": "${:,.2f}",
-        }).applymap(
-            lambda x: "color: green" if x > 0 else "color: red" if x < 0 else "",
+        }).apply(
+            lambda col: np.where(
+                col > 0, "color: green", np.where(col < 0, "color: red", "")
+            ),
             subset=["P&L"],
         ),
         use_container_width=True,
@@ -87,14 +87,15 @@ else:
     
     col1, col2, col3 = st.columns(3)
     
-    total_pnl = sum(pos.get("unrealized_pnl", 0) for pos in positions)
+    pnl = table["P&L"]
+    total_pnl = pc.sum(pnl).as_py() or 0.0
     
     with col1:
-        st.metric("Active Positions", len(positions))
+        st.metric("Active Positions", positions.num_rows)
     
     with col2:
         st.metric("Total Unrealized P&L", format_currency(total_pnl))
     
     with col3:
-        winning = sum(1 for pos in positions if pos.get("unrealized_pnl", 0) > 0)
-        st.metric("Winning", f"{winning}/{len(positions)}")
+        winning = pc.sum(pc.greater(pnl, 0)).as_py() or 0
+        st.metric("Winning", f"{winning}/{positions.num_rows}")
@@ -7,11 +7,13 @@ Created: 2026-02-13
 import streamlit as st
 import pandas as pd
 import plotly.graph_objects as go
-import random
-from datetime import datetime, timedelta
+from datetime import datetime
+from typing import Callable
 
+import numpy as np
+
+from src.presentation.dashboard._client import get_api_client
 from src.presentation.dashboard.components import (
-    APIClient,
     StateManager,
 )
 from src.presentation.dashboard.components.chart_utils import (
@@ -29,10 +31,135 @@ st.set_page_config(
 # Initialize state
 state = StateManager()
 
-if not state.has("api_client"):
-    state.set("api_client", APIClient(base_url="http://localhost:8000"))
+api_client = get_api_client()
+
+# One generator per session for all sample data
+rng = state.get("rng") or np.random.default_rng()
+state.set("rng", rng)
+
+
+@st.cache_data(ttl=5)
+def _cached_bot_list(base_url: str) -> list:
+    """Bot list, memoized across reruns."""
+    return get_api_client(base_url).get_bot_list()
+
+
+@st.cache_data(ttl=5)
+def _cached_bot_metrics_bulk(base_url: str, bot_ids: tuple) -> dict:
+    """Metrics for each bot ID in one request, memoized across reruns."""
+    return get_api_client(base_url).get_bots_metrics_bulk(list(bot_ids))
+
+
+def session_sample(name: str, key: tuple, draw: Callable[[], tuple]) -> tuple:
+    """Sample data drawn once per session for a filter combination.
+    
+    Keeping the draw stable across reruns lets the figure caches below key
+    on the data itself.
+    
+    Args:
+        name: Session state slot
+        key: Filter values the sample belongs to
+        draw: Produces the sample as a hashable tuple
+    
+    Returns:
+        The stored sample
+    """
+    cached = state.get(name)
+    
+    if cached is None or cached[0] != key:
+        cached = (key, draw())
+        state.set(name, cached)
+    
+    return cached[1]
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def build_roi_trend(bot_ids: tuple, day: str, rois: tuple) -> go.Figure:
+    """ROI trend figure, shared read-only across reruns and sessions.
+    
+    Args:
+        bot_ids: Bot IDs, one per row of ``rois``
+        day: Last day on the X axis (ISO date)
+        rois: Daily ROI per bot, seven values each
+    
+    Returns:
+        Plotly figure
+    """
+    # All bots as one WebGL trace, series separated by NaN breaks
+    x = np.datetime64(day, "D") - np.arange(6, -1, -1) * np.timedelta64(1, "D")
+    
+    rois = np.array(rois, dtype=float)
+    n_bots, n_days = rois.shape
+    
+    x_all = np.tile(np.append(x, np.datetime64("NaT")), n_bots)
+    y_all = np.column_stack([rois, np.full(n_bots, np.nan)]).ravel()
+    bot_index = np.repeat(bot_ids, n_days + 1)
+    
+    fig = go.Figure(
+        go.Scattergl(
+            x=x_all,
+            y=y_all,
+            mode="lines+markers",
+            marker=dict(color=bot_index, colorscale="Viridis"),
+            customdata=bot_index,
+            hovertemplate="<b>Bot %{customdata}</b><br>%{x}<br>ROI: %{y:.2f}%<extra></extra>",
+            connectgaps=False,
+        )
+    )
+    
+    fig.update_layout({
+        **get_default_layout(),
+        "title": "7-Day ROI Trend",
+        "xaxis_title": "Date",
+        "yaxis_title": "ROI (%)",
+    })
+    
+    return fig
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def build_risk_scatter(bot_ids: tuple, sharpes: tuple, rois: tuple) -> go.Figure:
+    """Sharpe vs ROI scatter figure, shared read-only across reruns and sessions.
+    
+    Args:
+        bot_ids: Bot IDs
+        sharpes: Sharpe ratio per bot
+        rois: ROI per bot
+    
+    Returns:
+        Plotly figure
+    """
+    fig = go.Figure()
+    
+    x_data = list(sharpes)
+    y_data = list(rois)
+    
+    fig.add_trace(
+        go.Scattergl(
+            x=x_data,
+            y=y_data,
+            mode="markers",
+            marker=dict(
+                size=15,
+                color=y_data,
+                colorscale="RdYlGn",
+                showscale=True,
+                colorbar=dict(title="ROI (%)"),
+            ),
+            text=[f"Bot {bot_id}" for bot_id in bot_ids],
+            hovertemplate="<b>%{text}</b><br>Sharpe: %{x:.2f}<br>ROI: %{y:.2f}%<extra></extra>",
+        )
+    )
+    
+    fig.update_layout({
+        **get_default_layout(),
+        "title": "Sharpe Ratio vs ROI",
+        "xaxis_title": "Sharpe Ratio",
+        "yaxis_title": "ROI (%)",
+    })
+    
+    return fig
 
-api_client = state.get("api_client")
 
 # Header
 st.title("📈 Performance Analysis")
@@ -69,7 +196,7 @@ st.markdown("---")
 st.markdown("### 📊 Bot Performance Comparison")
 
 # Fetch bots
-bots = api_client.get_bot_list()
+bots = _cached_bot_list(api_client.base_url)
 
 if not bots:
     # Generate sample data
@@ -77,130 +204,119 @@ if not bots:
         {
             "bot_id": i+1,
             "strategy_type": ["Rebalancing", "Esports", "Market Making"][i % 3],
-            "state": random.choice(["ACTIVE", "PAUSED", "STOPPED"]),
+            "state": rng.choice(["ACTIVE", "PAUSED", "STOPPED"]),
         }
         for i in range(10)
     ]
 
 # Create performance dataframe
-performance_data = []
+bots_metrics = _cached_bot_metrics_bulk(
+    api_client.base_url,
+    tuple(bot.get("bot_id", 0) for bot in bots[:10]),
+)
 
-for bot in bots[:10]:
-    bot_id = bot.get("bot_id", 0)
-    metrics = api_client.get_bot_metrics(bot_id)
-    
-    if not metrics:
-        metrics = {
-            "pnl": random.uniform(-200, 800),
-            "roi": random.uniform(-10, 25),
-            "win_rate": random.uniform(45, 70),
-            "sharpe_ratio": random.uniform(0.3, 1.8),
-            "open_positions": random.randint(0, 5),
-        }
-    
-    performance_data.append({
-        "Bot ID": f"Bot {bot_id}",
-        "Strategy": bot.get("strategy_type", "Unknown"),
-        "ROI (%)": f"{metrics.get('roi', 0):.2f}",
-        "P&L ($)": f"{metrics.get('pnl', 0):+,.2f}",
-        "Win Rate (%)": f"{metrics.get('win_rate', 0):.1f}",
-        "Sharpe": f"{metrics.get('sharpe_ratio', 0):.2f}",
-        "Positions": metrics.get("open_positions", 0),
-        "Status": bot.get("state", "UNKNOWN"),
-    })
+# One frame from the bot list and the bulk metrics, row for row
+metric_columns = ["roi", "pnl", "win_rate", "sharpe_ratio", "open_positions"]
+raw = pd.concat(
+    [
+        pd.DataFrame(bots[:10], columns=["bot_id", "strategy_type", "state"]),
+        pd.DataFrame(
+            [bots_metrics.get(bot.get("bot_id", 0)) or {} for bot in bots[:10]],
+            columns=metric_columns,
+        ),
+    ],
+    axis=1,
+)
+
+# Sample metrics for bots without any
+missing = raw["roi"].isna().to_numpy()
+n_missing = int(missing.sum())
+if n_missing:
+    raw.loc[missing, metric_columns] = np.column_stack([
+        rng.uniform(-10, 25, n_missing),
+        rng.uniform(-200, 800, n_missing),
+        rng.uniform(45, 70, n_missing),
+        rng.uniform(0.3, 1.8, n_missing),
+        rng.integers(0, 6, n_missing),
+    ])
+
+raw = raw.fillna({
+    "bot_id": 0,
+    "strategy_type": "Unknown",
+    "state": "UNKNOWN",
+    **dict.fromkeys(metric_columns, 0),
+})
 
-df = pd.DataFrame(performance_data)
+df = pd.DataFrame({
+    "Bot ID": "Bot " + raw["bot_id"].astype(int).astype(str),
+    "Strategy": raw["strategy_type"],
+    "ROI (%)": raw["roi"],
+    "P&L ($)": raw["pnl"],
+    "Win Rate (%)": raw["win_rate"],
+    "Sharpe": raw["sharpe_ratio"],
+    "Positions": raw["open_positions"].astype(int),
+    "Status": raw["state"],
+})
 
-# Display dataframe with styling
+# Values stay numeric; the grid formats them client-side
 st.dataframe(
     df,
+    column_config={
+        "ROI (%)": st.column_config.NumberColumn(format="%.2f"),
+        "P&L ($)": st.column_config.NumberColumn(format="%+.2f"),
+        "Win Rate (%)": st.column_config.NumberColumn(format="%.1f"),
+        "Sharpe": st.column_config.NumberColumn(format="%.2f"),
+    },
     use_container_width=True,
     hide_index=True,
 )
 
-# Download button
-csv = df.to_csv(index=False)
-st.download_button(
-    label="📥 Download CSV",
-    data=csv,
-    file_name=f"bot_performance_{datetime.now().strftime('%Y%m%d')}.csv",
-    mime="text/csv",
-)
+# Download button (CSV is only built once export is requested)
+if st.checkbox("Prepare CSV export", key="performance_export"):
+    st.download_button(
+        label="📥 Download CSV",
+        data=df.to_csv(index=False).encode(),
+        file_name=f"bot_performance_{datetime.now().strftime('%Y%m%d')}.csv",
+        mime="text/csv",
+    )
 
 st.markdown("---")
 
 # Charts
+chart_bot_ids = tuple(bot.get("bot_id", i+1) for i, bot in enumerate(bots[:10]))
 col1, col2 = st.columns(2)
 
 with col1:
     st.markdown("### 📈 ROI Comparison (7d)")
     
-    # Multi-line ROI chart
-    fig = go.Figure()
-    
-    now = datetime.now()
-    x = [now - timedelta(days=i) for i in range(7, 0, -1)]
-    
-    for i in range(1, 6):  # Top 5 bots
-        y = [random.uniform(-2, 10) for _ in range(7)]
-        
-        fig.add_trace(
-            go.Scatter(
-                x=x,
-                y=y,
-                mode="lines+markers",
-                name=f"Bot {i}",
-            )
-        )
-    
-    layout = get_default_layout()
-    layout.update({
-        "title": "7-Day ROI Trend",
-        "xaxis_title": "Date",
-        "yaxis_title": "ROI (%)",
-        "legend": dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-    })
-    
-    fig.update_layout(**layout)
+    roi_ids = chart_bot_ids[:5]
+    rois = session_sample(
+        "roi_sample",
+        (roi_ids, date_range),
+        lambda: tuple(map(tuple, rng.uniform(-2, 10, (len(roi_ids), 7)).round(2))),
+    )
     
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(
+        build_roi_trend(roi_ids, datetime.now().date().isoformat(), rois),
+        use_container_width=True,
+    )
 
 with col2:
     st.markdown("### 🎯 Risk-Adjusted Performance")
     
-    # Scatter: Sharpe vs ROI
-    fig = go.Figure()
-    
-    x_data = [random.uniform(0.3, 1.8) for _ in range(10)]  # Sharpe
-    y_data = [random.uniform(-10, 25) for _ in range(10)]  # ROI
-    
-    fig.add_trace(
-        go.Scatter(
-            x=x_data,
-            y=y_data,
-            mode="markers",
-            marker=dict(
-                size=15,
-                color=y_data,
-                colorscale="RdYlGn",
-                showscale=True,
-                colorbar=dict(title="ROI (%)"),
-            ),
-            text=[f"Bot {i+1}" for i in range(10)],
-            hovertemplate="<b>%{text}</b><br>Sharpe: %{x:.2f}<br>ROI: %{y:.2f}%<extra></extra>",
-        )
+    sharpes, scatter_rois = session_sample(
+        "risk_sample",
+        (chart_bot_ids, date_range),
+        lambda: (
+            tuple(rng.uniform(0.3, 1.8, len(chart_bot_ids)).round(2)),
+            tuple(rng.uniform(-10, 25, len(chart_bot_ids)).round(2)),
+        ),
     )
     
-    layout = get_default_layout()
-    layout.update({
-        "title": "Sharpe Ratio vs ROI",
-        "xaxis_title": "Sharpe Ratio",
-        "yaxis_title": "ROI (%)",
-    })
-    
-    fig.update_layout(**layout)
-    
-    st.plotly_chart(fig, use_container_width=True)
+    st.plotly_chart(
+        build_risk_scatter(chart_bot_ids, sharpes, scatter_rois),
+        use_container_width=True,
+    )
 
 # Drawdown analysis
 st.markdown("### 📉 Drawdown Analysis")
@@ -208,13 +324,16 @@ st.markdown("### 📉 Drawdown Analysis")
 fig = go.Figure()
 
 bots_sample = [f"Bot {i+1}" for i in range(8)]
-drawdowns = [random.uniform(-25, -5) for _ in range(8)]
+drawdowns = rng.uniform(-25, -5, 8)
+drawdown_colors = np.select(
+    [drawdowns < -15, drawdowns < -10], ["red", "orange"], default="green"
+).tolist()
 
 fig.add_trace(
     go.Bar(
         x=bots_sample,
         y=drawdowns,
-        marker_color=["red" if d < -15 else "orange" if d < -10 else "green" for d in drawdowns],
+        marker_color=drawdown_colors,
     )
 )
 
@@ -222,16 +341,14 @@ fig.add_trace(
 fig.add_hline(y=-25, line_dash="dash", line_color="red", annotation_text="Emergency Halt")
 fig.add_hline(y=-15, line_dash="dash", line_color="orange", annotation_text="Warning")
 
-layout = get_default_layout()
-layout.update({
+fig.update_layout({
+    **get_default_layout(),
     "title": "Max Drawdown by Bot",
     "xaxis_title": "Bot",
     "yaxis_title": "Drawdown (%)",
     "height": 400,
 })
 
-fig.update_layout(**layout)
-
 st.plotly_chart(fig, use_container_width=True)
 
 # Trade distributions
@@ -242,51 +359,49 @@ col1, col2 = st.columns(2)
 with col1:
     st.markdown("#### P&L Distribution")
     
-    # Histogram
-    pnl_data = [random.uniform(-50, 150) for _ in range(100)]
+    # Histogram, pre-binned server-side
+    pnl_data = rng.uniform(-50, 150, 100)
+    counts, edges = np.histogram(pnl_data, bins=20)
     
     fig = go.Figure(
-        data=[go.Histogram(x=pnl_data, nbinsx=20)]
+        data=[
+            go.Bar(
+                x=(edges[:-1] + edges[1:]) / 2,
+                y=counts,
+                width=np.diff(edges),
+            )
+        ]
     )
     
-    layout = get_default_layout()
-    layout.update({
+    fig.update_layout({
+        **get_default_layout(),
         "title": "Trade P&L Distribution",
         "xaxis_title": "P&L ($)",
         "yaxis_title": "Frequency",
     })
     
-    fig.update_layout(**layout)
-    
     st.plotly_chart(fig, use_container_width=True)
 
 with col2:
     st.markdown("#### Position Hold Times")
     
     # Box plot
-    hold_times = {
-        f"Bot {i+1}": [random.uniform(0.5, 48) for _ in range(20)]
-        for i in range(5)
-    }
-    
-    fig = go.Figure()
+    hold_times = rng.uniform(0.5, 48, (5, 20))
     
-    for bot, times in hold_times.items():
-        fig.add_trace(
-            go.Box(
-                y=times,
-                name=bot,
-            )
+    # One Box trace grouped by bot label
+    fig = go.Figure(
+        go.Box(
+            x=np.repeat([f"Bot {i+1}" for i in range(len(hold_times))], hold_times.shape[1]),
+            y=hold_times.ravel(),
         )
+    )
     
-    layout = get_default_layout()
-    layout.update({
+    fig.update_layout({
+        **get_default_layout(),
         "title": "Hold Time Distribution",
         "yaxis_title": "Hours",
     })
     
-    fig.update_layout(**layout)
-    
     st.plotly_chart(fig, use_container_width=True)
 
 # Footer
@@ -6,17 +6,18 @@ and position detail modal with close capability.
 
 import asyncio
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from html import escape
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 from plotly.subplots import make_subplots
 
-from ..components.api_client import APIClient
-from ..components.metric_card import create_metric_card
-from ..components.websocket_client import WebSocketClient
+from src.presentation.dashboard._client import get_connection, get_ws_client
 
 # Page config
 st.set_page_config(
@@ -31,10 +32,20 @@ st.title("💰 Positions")
 st.markdown("Real-time position tracking with P&L analysis")
 
 # Initialize clients
-api_client = APIClient(base_url="http://localhost:8000", api_key="your-api-key-here")
-ws_client = WebSocketClient(url="ws://localhost:8000/ws/positions")
+api_client = get_connection()
+
+_METRIC_ROW_STYLE = """
+<style>
+.metric-row {display:flex;gap:16px;margin-bottom:12px}
+.metric-tile {flex:1}
+.metric-tile .label {font-size:14px;opacity:.7}
+.metric-tile .value {font-size:28px;font-weight:600}
+.metric-tile .caption {font-size:13px;opacity:.6}
+</style>
+"""
 
 
+@lru_cache(maxsize=4096)
 def format_pnl(pnl: float) -> str:
     """Format P&L with color and sign."""
     if pnl > 0:
@@ -45,6 +56,32 @@ def format_pnl(pnl: float) -> str:
         return f"<span style='color: #6b7280;'>${pnl:,.2f}</span>"
 
 
+def metric_row_html(tiles: List[Tuple[str, str, str]]) -> str:
+    """Build a row of metric tiles as a single HTML block.
+
+    Args:
+        tiles: ``(label, value_html, caption)`` triples; ``value_html`` is
+            inserted as-is so it can carry ``format_pnl`` colouring.
+    """
+    cells = "".join(
+        f"<div class='metric-tile'><div class='label'>{escape(label)}</div>"
+        f"<div class='value'>{value}</div>"
+        f"<div class='caption'>{escape(caption)}</div></div>"
+        for label, value, caption in tiles
+    )
+    return f"{_METRIC_ROW_STYLE}<div class='metric-row'>{cells}</div>"
+
+
+def color_pnl_column(pnl: pd.Series) -> List[str]:
+    """Background styles for a whole P&L column at once."""
+    return np.where(
+        pnl > 0,
+        "background-color: rgba(34, 197, 94, 0.2);",
+        np.where(pnl < 0, "background-color: rgba(239, 68, 68, 0.2);", ""),
+    ).tolist()
+
+
+@lru_cache(maxsize=4096)
 def format_duration(seconds: int) -> str:
     """Format duration human-readable."""
     if seconds < 60:
@@ -57,32 +94,89 @@ def format_duration(seconds: int) -> str:
         return f"{seconds // 86400}d {(seconds % 86400) // 3600}h"
 
 
-async def get_active_positions() -> List[Dict[str, Any]]:
-    """Fetch active positions from API."""
-    try:
-        response = await api_client.get("/api/v1/positions", params={"status": "open"})
-        return response.get("positions", [])
-    except Exception as e:
-        st.error(f"Error fetching active positions: {e}")
-        return []
+def format_durations(seconds: pd.Series) -> pd.Series:
+    """Vectorized ``format_duration`` over a column of seconds."""
+    seconds = seconds.astype(int)
+    minutes = (seconds // 60).astype(str)
+    hours = (seconds // 3600).astype(str)
+    days = (seconds // 86400).astype(str)
+    hour_minutes = ((seconds % 3600) // 60).astype(str)
+    day_hours = ((seconds % 86400) // 3600).astype(str)
+
+    return pd.Series(
+        np.select(
+            [seconds < 60, seconds < 3600, seconds < 86400],
+            [seconds.astype(str) + "s", minutes + "m", hours + "h " + hour_minutes + "m"],
+            default=days + "d " + day_hours + "h",
+        ),
+        index=seconds.index,
+    )
 
 
-async def get_closed_positions(limit: int = 100) -> List[Dict[str, Any]]:
-    """Fetch closed positions from API."""
+def fetch_positions(limit: int = 100) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Fetch active and closed positions from API concurrently."""
     try:
-        response = await api_client.get(
-            "/api/v1/positions", params={"status": "closed", "limit": limit}
+        active, closed = api_client.gather(
+            api_client.client.get("/api/v1/positions", params={"status": "open"}),
+            api_client.client.get(
+                "/api/v1/positions", params={"status": "closed", "limit": limit}
+            ),
         )
-        return response.get("positions", [])
+        return active.get("positions", []), closed.get("positions", [])
     except Exception as e:
-        st.error(f"Error fetching closed positions: {e}")
-        return []
+        st.error(f"Error fetching positions: {e}")
+        return [], []
+
+
+@st.cache_resource
+def start_position_feed() -> Dict[int, List[Dict[str, Any]]]:
+    """Subscribe to position pushes in the background.
+
+    One feed per server process: the WebSocket connections run on the
+    shared API connection's event loop and write each bot's latest open
+    positions into the returned dict, which pages read on their own
+    refresh cadence. Topics are subscribed for the bots the API lists
+    when the feed starts.
+
+    Returns:
+        Live open positions keyed by bot ID
+    """
+    live: Dict[int, List[Dict[str, Any]]] = {}
+    ws_client = get_ws_client()
+
+    def on_message(data: Dict[str, Any]) -> None:
+        if "positions" in data:
+            live[data["bot_id"]] = data["positions"]
+
+    async def run() -> None:
+        bots = (await api_client.client.list_bots()).get("bots", [])
+        await asyncio.gather(
+            *(ws_client.connect(f"positions/{bot['bot_id']}", on_message) for bot in bots)
+        )
+
+    api_client.submit(run())
+    return live
+
+
+def get_live_positions(fallback: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Active positions, live-fed bots overriding the REST ``fallback``.
 
+    Bots that have not pushed yet keep their positions from ``fallback``.
+    """
+    live = dict(start_position_feed())
 
-async def close_position(position_id: str) -> bool:
+    if not live:
+        return fallback
+
+    return [pos for pos in fallback if pos.get("bot_id") not in live] + [
+        pos for positions in live.values() for pos in positions
+    ]
+
+
+def close_position(position_id: str) -> bool:
     """Close position via API."""
     try:
-        await api_client.post(f"/api/v1/positions/{position_id}/close")
+        api_client.post(f"/api/v1/positions/{position_id}/close")
         st.success(f"Position {position_id} closed successfully")
         return True
     except Exception as e:
@@ -94,17 +188,18 @@ def render_position_detail_modal(position: Dict[str, Any]) -> None:
     """Render position detail modal."""
     st.subheader(f"Position {position['position_id'][:8]}")
 
-    # Entry info
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Entry Price", f"${position['entry_price']:.3f}")
-        st.caption(f"Opened: {position['opened_at']}")
-    with col2:
-        st.metric("Current Price", f"${position['current_price']:.3f}")
-        st.caption(f"Market: {position['market_id'][:8]}...")
-    with col3:
-        unrealized_pnl = position.get("unrealized_pnl", 0.0)
-        st.metric("Unrealized P&L", f"${unrealized_pnl:,.2f}", delta=f"{unrealized_pnl:,.2f}")
+    # Entry info (one element for all three tiles)
+    unrealized_pnl = position.get("unrealized_pnl", 0.0)
+    st.markdown(
+        metric_row_html(
+            [
+                ("Entry Price", f"${position['entry_price']:.3f}", f"Opened: {position['opened_at']}"),
+                ("Current Price", f"${position['current_price']:.3f}", f"Market: {position['market_id'][:8]}..."),
+                ("Unrealized P&L", format_pnl(unrealized_pnl), ""),
+            ]
+        ),
+        unsafe_allow_html=True,
+    )
 
     # P&L breakdown
     st.markdown("**P&L Breakdown**")
@@ -120,18 +215,18 @@ def render_position_detail_modal(position: Dict[str, Any]) -> None:
     st.dataframe(pd.DataFrame(pnl_data), use_container_width=True, hide_index=True)
 
     # Market context
-    st.markdown("**Market Context**")
-    col1, col2 = st.columns(2)
-    with col1:
-        st.caption(f"Liquidity: ${position.get('market_liquidity', 0):,.0f}")
-    with col2:
-        st.caption(f"Zone: {position.get('zone', 'N/A')}")
+    st.markdown(
+        "**Market Context**  \n"
+        f"Liquidity: ${position.get('market_liquidity', 0):,.0f} · "
+        f"Zone: {escape(str(position.get('zone', 'N/A')))}",
+        unsafe_allow_html=True,
+    )
 
     # Close action
     st.markdown("---")
     if st.button("🛑 Close Position", type="primary", use_container_width=True):
         if st.session_state.get("confirm_close"):
-            asyncio.run(close_position(position["position_id"]))
+            close_position(position["position_id"])
             st.session_state["confirm_close"] = False
             st.rerun()
         else:
@@ -145,44 +240,44 @@ def render_active_positions_table(positions: List[Dict[str, Any]]) -> None:
         st.info("No active positions")
         return
 
-    # Prepare data
-    data = []
-    for pos in positions:
-        now = datetime.utcnow()
-        opened = datetime.fromisoformat(pos["opened_at"].replace("Z", "+00:00"))
-        duration_seconds = int((now - opened).total_seconds())
-
-        data.append(
-            {
-                "Bot": pos["bot_id"],
-                "Market": pos["market_id"][:12] + "...",
-                "Side": pos["side"],
-                "Size": f"{pos['size']:.2f}",
-                "Entry": f"${pos['entry_price']:.3f}",
-                "Current": f"${pos['current_price']:.3f}",
-                "P&L": pos.get("unrealized_pnl", 0.0),
-                "Duration": format_duration(duration_seconds),
-                "Zone": pos.get("zone", "N/A"),
-                "Status": "OPEN",
-            }
-        )
-
-    df = pd.DataFrame(data)
+    # Prepare data, one column at a time
+    raw = pd.DataFrame(positions)
+    opened = pd.to_datetime(raw["opened_at"], utc=True)
+    duration_seconds = (pd.Timestamp.now(tz="UTC") - opened).dt.total_seconds()
+
+    df = pd.DataFrame(
+        {
+            "Bot": raw["bot_id"],
+            "Market": raw["market_id"].str.slice(0, 12) + "...",
+            "Side": raw["side"],
+            "Size": raw["size"],
+            "Entry": raw["entry_price"],
+            "Current": raw["current_price"],
+            "P&L": raw.get("unrealized_pnl", pd.Series(0.0, index=raw.index)).fillna(0.0),
+            "Duration": format_durations(duration_seconds),
+            "Zone": raw.get("zone", pd.Series("N/A", index=raw.index)).fillna("N/A"),
+            "Status": "OPEN",
+        }
+    )
 
     # Sort by P&L descending
     df = df.sort_values("P&L", ascending=False)
 
     # Color-code P&L
-    def color_pnl(val: float) -> str:
-        if val > 0:
-            return "background-color: rgba(34, 197, 94, 0.2);"
-        elif val < 0:
-            return "background-color: rgba(239, 68, 68, 0.2);"
-        return ""
-
-    styled_df = df.style.applymap(color_pnl, subset=["P&L"])
-
-    st.dataframe(styled_df, use_container_width=True, height=400, hide_index=True)
+    styled_df = df.style.apply(color_pnl_column, subset=["P&L"])
+
+    st.dataframe(
+        styled_df,
+        column_config={
+            "Size": st.column_config.NumberColumn(format="%.2f"),
+            "Entry": st.column_config.NumberColumn(format="$%.3f"),
+            "Current": st.column_config.NumberColumn(format="$%.3f"),
+            "P&L": st.column_config.NumberColumn(format="$%+.2f"),
+        },
+        use_container_width=True,
+        height=400,
+        hide_index=True,
+    )
 
     # Click to view details
     st.caption("💡 Click on a row to view position details (coming soon)")
@@ -194,57 +289,67 @@ def render_closed_positions_history(positions: List[Dict[str, Any]]) -> None:
         st.info("No closed positions")
         return
 
+    raw = pd.DataFrame(positions).reindex(
+        columns=[
+            "closed_at", "bot_id", "market_id", "side", "entry_price",
+            "exit_price", "realized_pnl", "hold_duration_seconds",
+        ]
+    )
+    pnl = raw["realized_pnl"].fillna(0.0)
+    hold_seconds = raw["hold_duration_seconds"].fillna(0)
+
     # Metrics summary
-    total_pnl = sum(pos.get("realized_pnl", 0.0) for pos in positions)
-    avg_hold_time = sum(
-        pos.get("hold_duration_seconds", 0) for pos in positions
-    ) / len(positions)
-    winners = sum(1 for pos in positions if pos.get("realized_pnl", 0.0) > 0)
-    win_rate = (winners / len(positions)) * 100 if positions else 0.0
-
-    col1, col2, col3, col4 = st.columns(4)
-    with col1:
-        st.metric("Total P&L", f"${total_pnl:,.2f}")
-    with col2:
-        st.metric("Avg Hold Time", format_duration(int(avg_hold_time)))
-    with col3:
-        st.metric("Win Rate", f"{win_rate:.1f}%")
-    with col4:
-        st.metric("Total Closed", len(positions))
+    total_pnl = pnl.sum()
+    avg_hold_time = hold_seconds.mean()
+    win_rate = (pnl > 0).mean() * 100
+
+    st.markdown(
+        metric_row_html(
+            [
+                ("Total P&L", format_pnl(total_pnl), ""),
+                ("Avg Hold Time", format_duration(int(avg_hold_time)), ""),
+                ("Win Rate", f"{win_rate:.1f}%", ""),
+                ("Total Closed", str(len(raw)), ""),
+            ]
+        ),
+        unsafe_allow_html=True,
+    )
 
     # Table
-    data = []
-    for pos in positions:
-        data.append(
-            {
-                "Closed": pos.get("closed_at", "N/A")[:16],
-                "Bot": pos["bot_id"],
-                "Market": pos["market_id"][:12] + "...",
-                "Side": pos["side"],
-                "Entry": f"${pos['entry_price']:.3f}",
-                "Exit": f"${pos.get('exit_price', 0):.3f}",
-                "P&L": pos.get("realized_pnl", 0.0),
-                "Hold": format_duration(pos.get("hold_duration_seconds", 0)),
-            }
-        )
-
-    df = pd.DataFrame(data)
+    df = pd.DataFrame(
+        {
+            "Closed": raw["closed_at"].fillna("N/A").str.slice(0, 16),
+            "Bot": raw["bot_id"],
+            "Market": raw["market_id"].str.slice(0, 12) + "...",
+            "Side": raw["side"],
+            "Entry": raw["entry_price"],
+            "Exit": raw["exit_price"].fillna(0),
+            "P&L": pnl,
+            "Hold": format_durations(hold_seconds),
+        }
+    )
 
     # Color-code P&L
-    def color_pnl(val: float) -> str:
-        if val > 0:
-            return "background-color: rgba(34, 197, 94, 0.2);"
-        elif val < 0:
-            return "background-color: rgba(239, 68, 68, 0.2);"
-        return ""
-
-    styled_df = df.style.applymap(color_pnl, subset=["P&L"])
-
-    st.dataframe(styled_df, use_container_width=True, height=300, hide_index=True)
+    styled_df = df.style.apply(color_pnl_column, subset=["P&L"])
+
+    st.dataframe(
+        styled_df,
+        column_config={
+            "Entry": st.column_config.NumberColumn(format="$%.3f"),
+            "Exit": st.column_config.NumberColumn(format="$%.3f"),
+            "P&L": st.column_config.NumberColumn(format="$%+.2f"),
+        },
+        use_container_width=True,
+        height=300,
+        hide_index=True,
+    )
 
 
+@st.fragment
 def render_position_heatmap(positions: List[Dict[str, Any]]) -> None:
     """Render position heatmap (size vs P&L)."""
+    positions = get_live_positions(positions)
+
     if not positions:
         st.info("No positions to display")
         return
@@ -269,6 +374,7 @@ def render_position_heatmap(positions: List[Dict[str, Any]]) -> None:
         color="Zone",
         hover_data=["Bot", "Market"],
         title="Position Heatmap: Size vs P&L",
+        render_mode="webgl",
         color_discrete_map={
             "ZONE_1": "#ef4444",
             "ZONE_2": "#f59e0b",
@@ -283,12 +389,14 @@ def render_position_heatmap(positions: List[Dict[str, Any]]) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
+@st.fragment
 def render_portfolio_value_chart() -> None:
     """Render portfolio value evolution chart."""
     # Mock data (replace with API call)
     times = pd.date_range(end=datetime.utcnow(), periods=100, freq="5min")
-    realized = [5000 + i * 10 + (i % 10) * 50 for i in range(100)]
-    unrealized = [(i % 15) * 100 - 200 for i in range(100)]
+    i = np.arange(100)
+    realized = 5000 + i * 10 + (i % 10) * 50
+    unrealized = (i % 15) * 100 - 200
 
     fig = go.Figure()
 
@@ -319,6 +427,9 @@ def render_portfolio_value_chart() -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
+# One concurrent fetch per run, shared by all tabs
+active_positions, closed_positions = fetch_positions(limit=100)
+
 # Main layout
 tab1, tab2, tab3 = st.tabs(["📊 Active Positions", "📜 Closed History", "🗺️ Heatmap"])
 
@@ -328,23 +439,18 @@ with tab1:
     # Auto-refresh toggle
     auto_refresh = st.checkbox("Auto-refresh (1s)", value=True)
 
-    # Fetch active positions
-    active_positions = asyncio.run(get_active_positions())
+    # Only the table reruns on the refresh tick; positions are pushed
+    # into the live feed between ticks
+    @st.fragment(run_every="1s" if auto_refresh else None)
+    def render_live_positions() -> None:
+        render_active_positions_table(get_live_positions(active_positions))
 
-    # Positions table
-    render_active_positions_table(active_positions)
+    render_live_positions()
 
     # Portfolio value chart
     st.markdown("---")
     render_portfolio_value_chart()
 
-    # Auto-refresh
-    if auto_refresh:
-        import time
-
-        time.sleep(1)
-        st.rerun()
-
 with tab2:
     st.markdown("### Closed Positions History")
 
@@ -357,22 +463,17 @@ with tab2:
     with col3:
         date_range = st.selectbox("Date Range", ["Last 24h", "Last 7d", "Last 30d", "All"])
 
-    # Fetch closed positions
-    closed_positions = asyncio.run(get_closed_positions(limit=100))
-
     # Apply filters (simplified - would filter in API in production)
     filtered = closed_positions
 
     # Render history
     render_closed_positions_history(filtered)
 
-    # Export button
-    if st.button("📥 Export to CSV"):
-        df = pd.DataFrame(filtered)
-        csv = df.to_csv(index=False)
+    # Export button (CSV is only built once export is requested)
+    if filtered and st.checkbox("Prepare CSV export", key="closed_positions_export"):
         st.download_button(
-            label="Download CSV",
-            data=csv,
+            label="📥 Export to CSV",
+            data=pd.DataFrame(filtered).to_csv(index=False).encode(),
             file_name=f"closed_positions_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
         )
@@ -381,9 +482,6 @@ with tab3:
     st.markdown("### Position Heatmap")
     st.caption("Bubble size = position size, color = zone, Y-axis = unrealized P&L")
 
-    # Fetch active positions
-    active_positions = asyncio.run(get_active_positions())
-
     # Render heatmap
     render_position_heatmap(active_positions)
 
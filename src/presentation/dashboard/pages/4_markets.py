@@ -1,16 +1,27 @@
 """Markets page."""
 
+import pandas as pd
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 
 st.set_page_config(page_title="Markets", page_icon="🏪", layout="wide")
 
 st.title("🏪 Markets")
 
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
+
+
+@st.cache_data(ttl=30)
+def _fetch_markets(base_url: str, active: bool, min_liquidity: float, limit: int) -> list:
+    """Markets for a filter combination, memoized across reruns."""
+    return get_api_client(base_url).list_markets(
+        active=active,
+        min_liquidity=min_liquidity,
+        limit=limit,
+    )
+
 
 # Filters
 st.subheader("🔍 Filters")
@@ -32,15 +43,14 @@ with col2:
 with col3:
     limit = st.slider("Max results", 10, 200, 50)
 
+if st.button("🔄 Refresh"):
+    _fetch_markets.clear()
+
 st.markdown("---")
 
 # Fetch markets
 try:
-    markets = client.list_markets(
-        active=active_only,
-        min_liquidity=min_liquidity,
-        limit=limit,
-    )
+    markets = _fetch_markets(client.base_url, active_only, min_liquidity, limit)
 except Exception as e:
     st.error(f"Failed to fetch markets: {e}")
     markets = []
@@ -49,56 +59,80 @@ except Exception as e:
 st.subheader(f"📊 Markets ({len(markets)} found)")
 
 if markets:
-    for market in markets:
-        # Calculate spread
-        spread = None
-        if market.get("yes_price") and market.get("no_price"):
-            spread = abs(float(market["yes_price"]) - 0.5) * 2
+    # Derived fields for all markets at once
+    mdf = pd.DataFrame(markets)
+    mdf["yes"] = pd.to_numeric(mdf.get("yes_price"), errors="coerce")
+    mdf["no"] = pd.to_numeric(mdf.get("no_price"), errors="coerce")
+    mdf["spread"] = ((mdf["yes"] - 0.5).abs() * 2).where(mdf["no"].notna())
+    
+    # Bot 8 opportunity: extreme price with a wide spread
+    mdf["is_opp"] = ((mdf["yes"] < 0.20) | (mdf["yes"] > 0.80)) & (mdf["spread"] > 0.15)
+    
+    if "volume_24h" not in mdf:
+        mdf["volume_24h"] = None
+    if "resolves_at" not in mdf:
+        mdf["resolves_at"] = None
+    
+    # One virtualized table instead of an expander per market
+    event = st.dataframe(
+        mdf[["is_opp", "question", "liquidity", "volume_24h", "yes", "no", "spread", "created_at"]],
+        column_config={
+            "is_opp": st.column_config.CheckboxColumn("🎯"),
+            "question": st.column_config.TextColumn("Question", width="large"),
+            "liquidity": st.column_config.NumberColumn("Liquidity", format="$%.0f"),
+            "volume_24h": st.column_config.NumberColumn("Volume 24h", format="$%.0f"),
+            "yes": st.column_config.NumberColumn("YES", format="%.4f"),
+            "no": st.column_config.NumberColumn("NO", format="%.4f"),
+            "spread": st.column_config.ProgressColumn("Spread", min_value=0.0, max_value=1.0, format="%.2f"),
+            "created_at": st.column_config.DatetimeColumn("Created", format="YYYY-MM-DD"),
+        },
+        hide_index=True,
+        use_container_width=True,
+        on_select="rerun",
+        selection_mode="single-row",
+        key="markets_table",
+    )
+    
+    # Detail view for the selected market only
+    if event.selection.rows:
+        market = mdf.iloc[event.selection.rows[0]]
         
-        # Bot 8 opportunity?
-        is_opportunity = False
-        if market.get("yes_price"):
-            yes_price = float(market["yes_price"])
-            if yes_price < 0.20 or yes_price > 0.80:
-                is_opportunity = spread and spread > 0.15
+        st.markdown(f"#### {'🎯 ' if market.is_opp else ''}{market.question}")
         
-        opportunity_emoji = "🎯" if is_opportunity else ""
+        col1, col2, col3, col4 = st.columns(4)
         
-        with st.expander(
-            f"{opportunity_emoji} {market['question'][:80]}..."
-        ):
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.metric("Liquidity", f"${market['liquidity']:,.0f}")
-                st.metric(
-                    "Volume 24h",
-                    f"${market['volume_24h']:,.0f}" if market.get('volume_24h') else "N/A"
-                )
-            
-            with col2:
-                st.metric(
-                    "YES Price",
-                    f"{float(market['yes_price']):.4f}" if market.get('yes_price') else "N/A"
-                )
-                st.metric(
-                    "NO Price",
-                    f"{float(market['no_price']):.4f}" if market.get('no_price') else "N/A"
-                )
+        with col1:
+            st.metric("Liquidity", f"${market.liquidity:,.0f}")
+            st.metric(
+                "Volume 24h",
+                f"${market.volume_24h:,.0f}" if pd.notna(market.volume_24h) else "N/A"
+            )
+        
+        with col2:
+            st.metric(
+                "YES Price",
+                f"{market.yes:.4f}" if pd.notna(market.yes) else "N/A"
+            )
+            st.metric(
+                "NO Price",
+                f"{market.no:.4f}" if pd.notna(market.no) else "N/A"
+            )
+        
+        with col3:
+            if pd.notna(market.spread):
+                st.metric("Spread", f"{market.spread*100:.1f}%")
             
-            with col3:
-                if spread is not None:
-                    st.metric("Spread", f"{spread*100:.1f}%")
-                
-                if is_opportunity:
-                    st.success("🎯 Bot 8 Opportunity!")
-                    st.caption("Spread >15% + extreme price")
+            if market.is_opp:
+                st.success("🎯 Bot 8 Opportunity!")
+                st.caption("Spread >15% + extreme price")
+        
+        with col4:
+            st.caption(f"Market ID: {market.market_id[:16]}...")
+            st.caption(f"Created: {market.created_at[:10]}")
             
-            with col4:
-                st.caption(f"Market ID: {market['market_id'][:16]}...")
-                st.caption(f"Created: {market['created_at'][:10]}")
-                
-                if market.get('resolves_at'):
-                    st.caption(f"Resolves: {market['resolves_at'][:10]}")
+            if pd.notna(market.resolves_at):
+                st.caption(f"Resolves: {market.resolves_at[:10]}")
+    else:
+        st.caption("Select a row to see market details")
 else:
     st.info("No markets found matching filters")
@@ -4,12 +4,9 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
-import asyncio
-
-import pandas as pd
 import streamlit as st
 
-from src.presentation.dashboard.api_client import APIClient
+from src.presentation.dashboard._client import get_connection
 from src.presentation.dashboard.utils import format_currency, format_timestamp
 
 st.set_page_config(page_title="Orders", page_icon="📜", layout="wide")
@@ -17,13 +14,17 @@ st.set_page_config(page_title="Orders", page_icon="📜", layout="wide")
 st.title("📜 Order Log")
 
 # Initialize API client
-if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
+api_client = get_connection()
+
+
+@st.cache_data(ttl=30)
+def _fetch_orders(bot_id):
+    """Orders for a bot filter, memoized across reruns."""
+    return get_connection().list_orders(bot_id=bot_id).get("orders", [])
 
-api_client = st.session_state.api_client
 
 # Filters
-col1, col2 = st.columns(2)
+col1, col2, col3 = st.columns([3, 3, 1])
 
 with col1:
     bot_filter = st.selectbox(
@@ -38,13 +39,16 @@ with col2:
         default=[],
     )
 
+with col3:
+    if st.button("🔄 Refresh"):
+        _fetch_orders.clear()
 
-async def load_orders():
+
+def load_orders():
     """Load orders list."""
     try:
         bot_id = None if bot_filter == "All" else int(bot_filter.split()[1])
-        result = await api_client.list_orders(bot_id=bot_id)
-        orders = result.get("orders", [])
+        orders = _fetch_orders(bot_id)
         
         # Filter by status
         if status_filter:
@@ -56,11 +60,14 @@ async def load_orders():
         return []
 
 
-orders = asyncio.run(load_orders())
+orders = load_orders()
 
 if not orders:
     st.info("No orders found.")
 else:
+    # Only pay the pandas import when there is something to show
+    import pandas as pd
+    
     # Orders table
     df_data = []
     for order in orders:
@@ -4,16 +4,19 @@ Real-time order monitoring with fill rates, latency analysis,
 and rejection tracking.
 """
 
-import asyncio
+import io
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
 
-from ..components.api_client import APIClient
+from src.presentation.dashboard._client import get_connection
+from ..components.chart_utils import create_latency_histogram
 from ..components.metric_card import create_metric_card
 
 # Page config
@@ -29,61 +32,96 @@ st.title("📜 Order Log")
 st.markdown("Real-time order execution tracking and analysis")
 
 # Initialize API client
-api_client = APIClient(base_url="http://localhost:8000", api_key="your-api-key-here")
+api_client = get_connection()
+
+# Latency bucket edges (ms) for the distribution chart
+LATENCY_BUCKET_EDGES = [0, 50, 100, 200, np.inf]
+LATENCY_BUCKET_LABELS = ["0-50ms", "50-100ms", "100-200ms", ">200ms"]
+
+# Status -> (badge color, emoji)
+STATUS_BADGES = {
+    "FILLED": ("#22c55e", "✅"),
+    "PARTIALLY_FILLED": ("#f59e0b", "🔶"),
+    "PENDING": ("#3b82f6", "🔵"),
+    "CANCELED": ("#6b7280", "⚪"),
+    "REJECTED": ("#ef4444", "❌"),
+    "EXPIRED": ("#9ca3af", "⏱️"),
+}
+
+# Status -> table cell background
+STATUS_STYLES = {
+    "FILLED": "background-color: rgba(34, 197, 94, 0.2);",
+    "REJECTED": "background-color: rgba(239, 68, 68, 0.2);",
+    "PARTIALLY_FILLED": "background-color: rgba(245, 158, 11, 0.2);",
+}
 
 
 def get_status_badge(status: str) -> str:
     """Get colored badge for order status."""
-    colors = {
-        "FILLED": ("#22c55e", "✅"),
-        "PARTIALLY_FILLED": ("#f59e0b", "🔶"),
-        "PENDING": ("#3b82f6", "🔵"),
-        "CANCELED": ("#6b7280", "⚪"),
-        "REJECTED": ("#ef4444", "❌"),
-        "EXPIRED": ("#9ca3af", "⏱️"),
-    }
-    color, emoji = colors.get(status, ("#6b7280", "●"))
+    color, emoji = STATUS_BADGES.get(status, ("#6b7280", "●"))
     return f"<span style='color: {color}; font-weight: 600;'>{emoji} {status}</span>"
 
 
-async def get_orders(
+def order_params(
+    bot_id: str | None = None,
+    status: str | None = None,
+    time_range: str = "24h",
+    order_type: str | None = None,
+) -> Dict[str, Any]:
+    """Build the orders query from the page filters."""
+    params = {}
+    if bot_id and bot_id != "All":
+        params["bot_id"] = bot_id
+    if status and status != "All":
+        params["status"] = status
+    if order_type and order_type != "All":
+        params["order_type"] = order_type
+
+    # Time range
+    if time_range != "All":
+        hours = {"1h": 1, "6h": 6, "24h": 24, "7d": 168}.get(time_range, 24)
+        since = datetime.utcnow() - timedelta(hours=hours)
+        params["since"] = since.isoformat()
+
+    return params
+
+
+@st.cache_data(ttl=1.5, show_spinner=False)
+def load_orders(
     bot_id: str | None = None,
     status: str | None = None,
     time_range: str = "24h",
     order_type: str | None = None,
-) -> List[Dict[str, Any]]:
-    """Fetch orders from API with filters."""
-    try:
-        params = {}
-        if bot_id and bot_id != "All":
-            params["bot_id"] = bot_id
-        if status and status != "All":
-            params["status"] = status
-        if order_type and order_type != "All":
-            params["order_type"] = order_type
-
-        # Time range
-        if time_range != "All":
-            hours = {"1h": 1, "6h": 6, "24h": 24, "7d": 168}.get(time_range, 24)
-            since = datetime.utcnow() - timedelta(hours=hours)
-            params["since"] = since.isoformat()
-
-        response = await api_client.get("/api/v1/orders", params=params)
-        return response.get("orders", [])
-    except Exception as e:
-        st.error(f"Error fetching orders: {e}")
-        return []
-
-
-async def get_order_metrics(time_range: str = "24h") -> Dict[str, Any]:
-    """Fetch order execution metrics."""
-    try:
-        params = {"time_range": time_range}
-        response = await api_client.get("/api/v1/metrics/orders", params=params)
-        return response
-    except Exception as e:
-        st.error(f"Error fetching order metrics: {e}")
-        return {}
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Fetch orders and order execution metrics in one concurrent round trip.
+
+    Memoized per filter set for just under the 2s refresh interval, so
+    overlapping reruns share one request pair.
+    """
+    orders, metrics = api_client.gather(
+        api_client.client.get(
+            "/api/v1/orders", params=order_params(bot_id, status, time_range, order_type)
+        ),
+        api_client.client.get("/api/v1/metrics/orders", params={"time_range": time_range}),
+        return_exceptions=True,
+    )
+
+    if isinstance(orders, Exception):
+        st.error(f"Error fetching orders: {orders}")
+        orders = {}
+    if isinstance(metrics, Exception):
+        st.error(f"Error fetching order metrics: {metrics}")
+        metrics = {}
+
+    return orders.get("orders", []), metrics
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def orders_csv(orders: pd.DataFrame) -> bytes:
+    """Encode orders as CSV bytes, cached on the frame's full contents."""
+    buf = io.BytesIO()
+    orders.to_csv(buf, index=False)
+    return buf.getvalue()
 
 
 def render_order_detail_modal(order: Dict[str, Any]) -> None:
@@ -146,48 +184,52 @@ def render_order_detail_modal(order: Dict[str, Any]) -> None:
         st.caption(f"Slippage: {order.get('slippage_pct', 0):.2f}%")
 
 
+def color_status_column(status: pd.Series) -> pd.Series:
+    """Background styles for a whole status column at once."""
+    return status.map(STATUS_STYLES).fillna("")
+
+
 def render_orders_table(orders: List[Dict[str, Any]]) -> None:
     """Render orders execution table."""
     if not orders:
         st.info("No orders found with current filters")
         return
 
-    # Prepare data
-    data = []
-    for order in orders:
-        fill_pct = (
-            (order.get("filled_size", 0) / order["size"]) * 100 if order.get("filled_size") else 0.0
-        )
-        data.append(
-            {
-                "Time": order["created_at"][:16],
-                "Bot": order["bot_id"],
-                "Market": order["market_id"][:10] + "...",
-                "Side": order["side"],
-                "Type": order["order_type"],
-                "Size": f"{order['size']:.2f}",
-                "Price": f"${order['price']:.3f}",
-                "Status": order["status"],
-                "Fill%": f"{fill_pct:.0f}%",
-                "Latency": f"{order.get('ack_latency_ms', 0):.0f}ms",
-            }
-        )
-
-    df = pd.DataFrame(data)
-
-    # Color-code status
-    def color_status(val: str) -> str:
-        if val == "FILLED":
-            return "background-color: rgba(34, 197, 94, 0.2);"
-        elif val == "REJECTED":
-            return "background-color: rgba(239, 68, 68, 0.2);"
-        elif val == "PARTIALLY_FILLED":
-            return "background-color: rgba(245, 158, 11, 0.2);"
-        return ""
-
-    styled_df = df.style.applymap(color_status, subset=["Status"])
+    # Prepare data, one column at a time
+    raw = pd.DataFrame(orders)
+    filled = raw.get("filled_size", pd.Series(0.0, index=raw.index)).fillna(0.0)
+    latency = raw.get("ack_latency_ms", pd.Series(0.0, index=raw.index)).fillna(0.0)
+
+    df = pd.DataFrame(
+        {
+            "Time": raw["created_at"].str.slice(0, 16),
+            "Bot": raw["bot_id"],
+            "Market": raw["market_id"].str.slice(0, 10) + "...",
+            "Side": raw["side"],
+            "Type": raw["order_type"],
+            "Size": raw["size"],
+            "Price": raw["price"],
+            "Status": raw["status"],
+            "Fill%": (filled / raw["size"].replace(0, np.nan) * 100).fillna(0),
+            "Latency": latency,
+        }
+    )
 
-    st.dataframe(styled_df, use_container_width=True, height=400, hide_index=True)
+    # Color-code status, whole column at once
+    styled_df = df.style.apply(color_status_column, subset=["Status"])
+
+    st.dataframe(
+        styled_df,
+        column_config={
+            "Size": st.column_config.NumberColumn(format="%.2f"),
+            "Price": st.column_config.NumberColumn(format="$%.3f"),
+            "Fill%": st.column_config.NumberColumn(format="%.0f%%"),
+            "Latency": st.column_config.NumberColumn(format="%.0fms"),
+        },
+        use_container_width=True,
+        height=400,
+        hide_index=True,
+    )
 
 
 def render_performance_metrics(metrics: Dict[str, Any]) -> None:
@@ -217,32 +259,18 @@ def render_latency_distribution(orders: List[Dict[str, Any]]) -> None:
         st.info("No data for latency distribution")
         return
 
-    # Extract latencies
-    latencies = [order.get("ack_latency_ms", 0) for order in orders if order.get("ack_latency_ms")]
+    # Extract latencies (missing or zero means no ack recorded)
+    latencies = np.fromiter(
+        (order.get("ack_latency_ms") or 0 for order in orders), dtype=np.float64, count=len(orders)
+    )
+    latencies = latencies[latencies > 0]
 
-    if not latencies:
+    if not latencies.size:
         st.info("No latency data available")
         return
 
-    # Create buckets
-    buckets = ["0-50ms", "50-100ms", "100-200ms", ">200ms"]
-    counts = [
-        sum(1 for lat in latencies if lat < 50),
-        sum(1 for lat in latencies if 50 <= lat < 100),
-        sum(1 for lat in latencies if 100 <= lat < 200),
-        sum(1 for lat in latencies if lat >= 200),
-    ]
-
-    fig = go.Figure(data=[go.Bar(x=buckets, y=counts, marker_color="#3b82f6")])
-
-    # Target line at p99
-    fig.add_hline(y=max(counts) * 0.99, line_dash="dash", line_color="#ef4444", annotation_text="p99 Target")
-
-    fig.update_layout(
-        title="Latency Distribution",
-        xaxis_title="Latency Bucket",
-        yaxis_title="Order Count",
-        height=300,
+    fig = create_latency_histogram(
+        latencies, LATENCY_BUCKET_EDGES, LATENCY_BUCKET_LABELS, "Latency Distribution"
     )
 
     st.plotly_chart(fig, use_container_width=True)
@@ -260,10 +288,7 @@ def render_rejection_analysis(orders: List[Dict[str, Any]]) -> None:
 
     with col1:
         # Rejection reasons pie chart
-        reasons = {}
-        for order in rejected_orders:
-            reason = order.get("rejection_reason", "Unknown")
-            reasons[reason] = reasons.get(reason, 0) + 1
+        reasons = Counter(order.get("rejection_reason", "Unknown") for order in rejected_orders)
 
         fig = px.pie(
             values=list(reasons.values()),
@@ -275,10 +300,7 @@ def render_rejection_analysis(orders: List[Dict[str, Any]]) -> None:
 
     with col2:
         # Rejections per bot bar chart
-        bot_rejections = {}
-        for order in rejected_orders:
-            bot = order["bot_id"]
-            bot_rejections[bot] = bot_rejections.get(bot, 0) + 1
+        bot_rejections = Counter(order["bot_id"] for order in rejected_orders)
 
         fig = go.Figure(data=[go.Bar(x=list(bot_rejections.keys()), y=list(bot_rejections.values()), marker_color="#ef4444")])
         fig.update_layout(title="Rejections by Bot", xaxis_title="Bot ID", yaxis_title="Count", height=300)
@@ -302,6 +324,13 @@ def render_trade_size_distribution(orders: List[Dict[str, Any]]) -> None:
     st.plotly_chart(fig, use_container_width=True)
 
 
+# Analysis selector label -> chart renderer
+ANALYSIS_VIEWS = {
+    "⏱️ Latency": render_latency_distribution,
+    "❌ Rejections": render_rejection_analysis,
+    "📊 Trade Sizes": render_trade_size_distribution,
+}
+
 # Main layout
 st.markdown("### Order Execution Log")
 
@@ -324,54 +353,48 @@ with col4:
 # Auto-refresh
 auto_refresh = st.checkbox("Auto-refresh (2s)", value=True)
 
-# Fetch data
-orders = asyncio.run(get_orders(filter_bot, filter_status, filter_time, filter_type))
-metrics = asyncio.run(get_order_metrics(filter_time))
-
-# Performance metrics
-st.markdown("---")
-render_performance_metrics(metrics)
-
-# Orders table
-st.markdown("---")
-st.markdown("**Execution Table**")
-render_orders_table(orders)
-
-# Export button
-if st.button("📥 Export to CSV"):
-    if orders:
-        df = pd.DataFrame(orders)
-        csv = df.to_csv(index=False)
+# Only the data sections rerun on the refresh tick; the title and
+# filters above stay as they are
+@st.fragment(run_every="2s" if auto_refresh else None)
+def render_order_log() -> None:
+    """Fetch orders and render metrics, table and analysis charts."""
+    # Fetch data
+    orders, metrics = load_orders(filter_bot, filter_status, filter_time, filter_type)
+
+    # Performance metrics
+    st.markdown("---")
+    render_performance_metrics(metrics)
+
+    # Orders table
+    st.markdown("---")
+    st.markdown("**Execution Table**")
+    render_orders_table(orders)
+
+    # Export button (CSV is only built once export is requested)
+    if orders and st.checkbox("Prepare CSV export", key="order_log_export"):
         st.download_button(
-            label="Download CSV",
-            data=csv,
+            label="📥 Export to CSV",
+            data=orders_csv(pd.DataFrame(orders)),
             file_name=f"order_log_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.csv",
             mime="text/csv",
         )
-    else:
-        st.warning("No orders to export")
-
-# Analysis charts
-st.markdown("---")
-st.markdown("### Performance Analysis")
-
-tab1, tab2, tab3 = st.tabs(["⏱️ Latency", "❌ Rejections", "📊 Trade Sizes"])
 
-with tab1:
-    render_latency_distribution(orders)
-
-with tab2:
-    render_rejection_analysis(orders)
-
-with tab3:
-    render_trade_size_distribution(orders)
+    # Analysis charts
+    st.markdown("---")
+    st.markdown("### Performance Analysis")
+
+    # Only the selected chart is built; st.tabs would build all three
+    view = st.radio(
+        "Analysis",
+        list(ANALYSIS_VIEWS),
+        horizontal=True,
+        label_visibility="collapsed",
+        key="order_analysis_view",
+    )
+    ANALYSIS_VIEWS[view](orders)
 
-# Auto-refresh
-if auto_refresh:
-    import time
 
-    time.sleep(2)
-    st.rerun()
+render_order_log()
 
 # Footer
 st.markdown("---")
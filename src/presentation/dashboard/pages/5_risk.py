@@ -1,8 +1,10 @@
 """Risk page."""
 
+import numpy as np
+import pandas as pd
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 from src.presentation.dashboard.components.charts import create_zone_exposure_chart
 
 st.set_page_config(page_title="Risk", page_icon="⚠️", layout="wide")
@@ -10,13 +12,19 @@ st.set_page_config(page_title="Risk", page_icon="⚠️", layout="wide")
 st.title("⚠️ Risk Management")
 
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
+
+
+@st.cache_data(ttl=1.5, show_spinner=False)
+def _fetch_risk(base_url: str) -> tuple:
+    """Risk and portfolio metrics, memoized across reruns."""
+    client = get_api_client(base_url)
+    return client.get_risk_metrics(), client.get_portfolio_metrics()
+
 
 # Fetch risk metrics
 try:
-    risk = client.get_risk_metrics()
-    portfolio = client.get_portfolio_metrics()
+    risk, portfolio = _fetch_risk(client.base_url)
 except Exception as e:
     st.error(f"Failed to fetch risk metrics: {e}")
     st.stop()
@@ -105,17 +113,23 @@ except Exception as e:
     positions = []
 
 if positions:
+    raw = pd.DataFrame(positions)
     st.dataframe(
-        [
+        pd.DataFrame(
             {
-                "Market": pos["market_id"][:12] + "...",
-                "Size": f"${pos['size']:,.0f}",
-                "% Portfolio": f"{(pos['size']/portfolio['total_value']*100):.2f}%",
-                "Zone": f"Z{pos['zone']}",
-                "Risk Level": "🟢 Low" if pos['zone'] <= 2 else "🟡 Medium" if pos['zone'] == 3 else "🔴 High",
+                "Market": raw["market_id"].str.slice(0, 12) + "...",
+                "Size": raw["size"],
+                "% Portfolio": raw["size"] / portfolio["total_value"] * 100,
+                "Zone": "Z" + raw["zone"].astype(str),
+                "Risk Level": np.select(
+                    [raw["zone"] <= 2, raw["zone"] == 3], ["🟢 Low", "🟡 Medium"], default="🔴 High"
+                ),
             }
-            for pos in positions
-        ],
+        ),
+        column_config={
+            "Size": st.column_config.NumberColumn(format="$%.0f"),
+            "% Portfolio": st.column_config.NumberColumn(format="%.2f%%"),
+        },
         use_container_width=True,
     )
 else:
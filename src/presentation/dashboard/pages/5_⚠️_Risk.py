@@ -4,11 +4,9 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
-import asyncio
-
 import streamlit as st
 
-from src.presentation.dashboard.api_client import APIClient
+from src.presentation.dashboard._client import get_connection
 from src.presentation.dashboard.utils import format_currency, format_percentage
 
 st.set_page_config(page_title="Risk Monitor", page_icon="⚠️", layout="wide")
@@ -16,22 +14,19 @@ st.set_page_config(page_title="Risk Monitor", page_icon="⚠️", layout="wide")
 st.title("⚠️ Risk Monitor")
 
 # Initialize API client
-if "api_client" not in st.session_state:
-    st.session_state.api_client = APIClient()
-
-api_client = st.session_state.api_client
+api_client = get_connection()
 
 
-async def load_risk_metrics():
+def load_risk_metrics():
     """Load risk metrics."""
     try:
-        return await api_client.get_risk_metrics()
+        return api_client.get_risk_metrics()
     except Exception as e:
         st.error(f"Error loading risk metrics: {e}")
         return {}
 
 
-risk_metrics = asyncio.run(load_risk_metrics())
+risk_metrics = load_risk_metrics()
 
 # Risk metrics
 st.subheader("Portfolio Risk Metrics")
@@ -68,16 +63,16 @@ st.divider()
 st.subheader("Circuit Breakers")
 
 
-async def load_circuit_breakers():
+def load_circuit_breakers():
     """Load circuit breaker statuses."""
     try:
-        return await api_client.get_circuit_breakers()
+        return api_client.get_circuit_breakers()
     except Exception as e:
         st.error(f"Error loading circuit breakers: {e}")
         return {}
 
 
-circuit_breakers = asyncio.run(load_circuit_breakers())
+circuit_breakers = load_circuit_breakers()
 
 col1, col2, col3, col4 = st.columns(4)
 
@@ -124,6 +119,6 @@ st.subheader("Emergency Controls")
 
 if st.button("🚨 EMERGENCY HALT ALL BOTS", type="primary"):
     if st.button("Confirm Emergency Halt"):
-        asyncio.run(api_client.emergency_halt())
+        api_client.emergency_halt()
         st.success("Emergency halt triggered!")
         st.rerun()
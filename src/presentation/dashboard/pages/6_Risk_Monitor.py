@@ -3,17 +3,17 @@
 Monitors zone exposure, circuit breakers, drawdowns, and risk alerts.
 """
 
-import asyncio
 from datetime import datetime
-from typing import Any, Dict, List
+from html import escape
+from operator import itemgetter
+from typing import Any, Dict, List, Tuple
 
-import pandas as pd
+import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from ..components.api_client import APIClient
+from src.presentation.dashboard._client import get_connection
 from ..components.metric_card import create_metric_card
-from ..components.websocket_client import WebSocketClient
 
 # Page config
 st.set_page_config(
@@ -28,66 +28,94 @@ st.title("⚠️ Risk Monitor")
 st.markdown("Real-time risk tracking and circuit breaker monitoring")
 
 # Initialize clients
-api_client = APIClient(base_url="http://localhost:8000", api_key="your-api-key-here")
-ws_client = WebSocketClient(url="ws://localhost:8000/ws/risk/alerts")
+api_client = get_connection()
 
+# Zone -> max exposure (% of capital)
+ZONE_LIMITS = {"ZONE_1": 30, "ZONE_2": 40, "ZONE_3": 60, "ZONE_4": 20, "ZONE_5": 10}
 
-async def get_risk_metrics() -> Dict[str, Any]:
-    """Fetch current risk metrics from API."""
-    try:
-        response = await api_client.get("/api/v1/risk/metrics")
-        return response
-    except Exception as e:
-        st.error(f"Error fetching risk metrics: {e}")
-        return {}
+# Alert severity -> (color, emoji)
+SEVERITY_STYLES = {
+    "INFO": ("#3b82f6", "🔵"),
+    "WARNING": ("#f59e0b", "⚠️"),
+    "CRITICAL": ("#ef4444", "🛑"),
+}
 
 
-async def get_circuit_breakers() -> List[Dict[str, Any]]:
-    """Fetch circuit breaker status."""
-    try:
-        response = await api_client.get("/api/v1/risk/circuit-breakers")
-        return response.get("circuit_breakers", [])
-    except Exception as e:
-        st.error(f"Error fetching circuit breakers: {e}")
-        return []
+@st.cache_data(ttl=1.5, show_spinner=False)
+def load_risk_state() -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Fetch risk metrics and circuit breaker status in one concurrent round trip.
 
+    Memoized briefly so overlapping reruns share one request pair.
+    """
+    metrics, breakers = api_client.gather(
+        api_client.client.get_risk_metrics(),
+        api_client.client.get_circuit_breakers(),
+        return_exceptions=True,
+    )
 
-def render_zone_exposure_grid(metrics: Dict[str, Any]) -> None:
-    """Render zone exposure grid with progress bars."""
-    zone_exposure = metrics.get("zone_exposure", {})
+    if isinstance(metrics, Exception):
+        st.error(f"Error fetching risk metrics: {metrics}")
+        metrics = {}
+    if isinstance(breakers, Exception):
+        st.error(f"Error fetching circuit breakers: {breakers}")
+        breakers = []
 
-    st.markdown("### Zone Exposure")
+    return metrics, breakers
 
-    zones = ["ZONE_1", "ZONE_2", "ZONE_3", "ZONE_4", "ZONE_5"]
-    limits = [30, 40, 60, 20, 10]  # % limits per zone
 
-    for i, (zone, limit) in enumerate(zip(zones, limits)):
-        exposure = zone_exposure.get(zone, {}).get("exposure_pct", 0.0)
-        exposed_capital = zone_exposure.get(zone, {}).get("exposed_capital_usdc", 0.0)
+def render_zone_exposure_grid(metrics: Dict[str, Any]) -> None:
+    """Render zone exposure as one bar chart against the zone limits."""
+    zone_exposure = metrics.get("zone_exposure", {})
 
-        # Color based on utilization
-        if exposure < limit * 0.7:
-            color = "#22c55e"  # Green - safe
-            status = "✅ Safe"
-        elif exposure < limit * 0.9:
-            color = "#f59e0b"  # Yellow - warning
-            status = "⚠️ Warning"
-        else:
-            color = "#ef4444"  # Red - danger
-            status = "🛑 Danger"
+    st.markdown("### Zone Exposure")
 
-        col1, col2, col3 = st.columns([2, 3, 1])
+    zones = list(ZONE_LIMITS)
+    limits = np.array(list(ZONE_LIMITS.values()), dtype=float)
+    exposures = np.array([zone_exposure.get(zone, {}).get("exposure_pct", 0.0) for zone in zones])
+    exposed_capital = [zone_exposure.get(zone, {}).get("exposed_capital_usdc", 0.0) for zone in zones]
+
+    # Color based on utilization
+    utilization = exposures / limits
+    bands = [utilization < 0.7, utilization < 0.9]
+    colors = np.select(bands, ["#22c55e", "#f59e0b"], default="#ef4444").tolist()
+    statuses = np.select(bands, ["✅ Safe", "⚠️ Warning"], default="🛑 Danger").tolist()
+
+    fig = go.Figure()
+
+    fig.add_trace(
+        go.Bar(
+            x=exposures,
+            y=zones,
+            orientation="h",
+            marker_color=colors,
+            hovertext=[
+                f"${capital:,.0f} ({exposure:.1f}% / {limit:.0f}%) {status}"
+                for capital, exposure, limit, status in zip(exposed_capital, exposures, limits, statuses)
+            ],
+            hoverinfo="y+text",
+        )
+    )
 
-        with col1:
-            st.markdown(f"**{zone}**")
-            st.caption(f"Limit: {limit}%")
+    # Limit marker per zone
+    fig.add_trace(
+        go.Scatter(
+            x=limits,
+            y=zones,
+            mode="markers",
+            marker=dict(symbol="line-ns", size=26, line=dict(width=3, color="#6b7280")),
+            hovertemplate="Limit: %{x:.0f}%<extra></extra>",
+        )
+    )
 
-        with col2:
-            st.progress(min(exposure / limit, 1.0))
-            st.caption(f"${exposed_capital:,.0f} ({exposure:.1f}% / {limit}%)")
+    fig.update_layout(
+        height=260,
+        margin=dict(l=20, r=20, t=10, b=20),
+        xaxis_title="Exposure (%)",
+        yaxis=dict(autorange="reversed"),
+        showlegend=False,
+    )
 
-        with col3:
-            st.markdown(f"<span style='color: {color};'>{status}</span>", unsafe_allow_html=True)
+    st.plotly_chart(fig, use_container_width=True)
 
 
 def render_circuit_breakers(circuit_breakers: List[Dict[str, Any]]) -> None:
@@ -128,6 +156,44 @@ def render_circuit_breakers(circuit_breakers: List[Dict[str, Any]]) -> None:
                 st.caption("No data available")
 
 
+@st.cache_resource(max_entries=64, show_spinner=False)
+def drawdown_gauge(
+    title: str, value: float, limit: float, axis_max: float, warn: float, danger: float
+) -> go.Figure:
+    """Build a drawdown gauge, shared read-only while its inputs repeat.
+
+    Drawdowns move slowly, so the 1s refresh mostly re-requests a figure
+    that is already built; a ``go.Figure`` is passed to ``st.plotly_chart``
+    without being revalidated.
+    """
+    fig = go.Figure(
+        go.Indicator(
+            mode="gauge+number+delta",
+            value=value,
+            title={"text": title},
+            domain={"x": [0, 1], "y": [0, 1]},
+            delta={"reference": limit},
+            gauge={
+                "axis": {"range": [None, axis_max]},
+                "bar": {"color": "#3b82f6"},
+                "steps": [
+                    {"range": [0, warn], "color": "#22c55e"},
+                    {"range": [warn, danger], "color": "#f59e0b"},
+                    {"range": [danger, axis_max], "color": "#ef4444"},
+                ],
+                "threshold": {
+                    "line": {"color": "red", "width": 4},
+                    "thickness": 0.75,
+                    "value": limit,
+                },
+            },
+        )
+    )
+
+    fig.update_layout(height=300)
+    return fig
+
+
 def render_drawdown_gauges(metrics: Dict[str, Any]) -> None:
     """Render drawdown gauge charts."""
     st.markdown("### Drawdown Monitoring")
@@ -138,66 +204,17 @@ def render_drawdown_gauges(metrics: Dict[str, Any]) -> None:
         # Portfolio drawdown
         portfolio_dd = metrics.get("portfolio_drawdown_pct", 0.0)
 
-        fig = go.Figure(
-            go.Indicator(
-                mode="gauge+number+delta",
-                value=portfolio_dd,
-                domain={"x": [0, 1], "y": [0, 1]},
-                title={"text": "Portfolio Drawdown %"},
-                delta={"reference": 40.0},
-                gauge={
-                    "axis": {"range": [None, 50]},
-                    "bar": {"color": "#3b82f6"},
-                    "steps": [
-                        {"range": [0, 20], "color": "#22c55e"},
-                        {"range": [20, 35], "color": "#f59e0b"},
-                        {"range": [35, 50], "color": "#ef4444"},
-                    ],
-                    "threshold": {
-                        "line": {"color": "red", "width": 4},
-                        "thickness": 0.75,
-                        "value": 40,
-                    },
-                },
-            )
-        )
-
-        fig.update_layout(height=300)
+        fig = drawdown_gauge("Portfolio Drawdown %", portfolio_dd, 40.0, 50, 20, 35)
         st.plotly_chart(fig, use_container_width=True)
 
     with col2:
         # Bot max drawdown
         bot_drawdowns = metrics.get("bot_drawdowns", {})
-        max_bot_dd = max(bot_drawdowns.values()) if bot_drawdowns else 0.0
-        max_bot_id = (
-            max(bot_drawdowns, key=bot_drawdowns.get) if bot_drawdowns else "N/A"
+        max_bot_id, max_bot_dd = (
+            max(bot_drawdowns.items(), key=itemgetter(1)) if bot_drawdowns else ("N/A", 0.0)
         )
 
-        fig = go.Figure(
-            go.Indicator(
-                mode="gauge+number+delta",
-                value=max_bot_dd,
-                domain={"x": [0, 1], "y": [0, 1]},
-                title={"text": f"Max Bot Drawdown % ({max_bot_id})"},
-                delta={"reference": 25.0},
-                gauge={
-                    "axis": {"range": [None, 40]},
-                    "bar": {"color": "#3b82f6"},
-                    "steps": [
-                        {"range": [0, 15], "color": "#22c55e"},
-                        {"range": [15, 22], "color": "#f59e0b"},
-                        {"range": [22, 40], "color": "#ef4444"},
-                    ],
-                    "threshold": {
-                        "line": {"color": "red", "width": 4},
-                        "thickness": 0.75,
-                        "value": 25,
-                    },
-                },
-            )
-        )
-
-        fig.update_layout(height=300)
+        fig = drawdown_gauge(f"Max Bot Drawdown % ({max_bot_id})", max_bot_dd, 25.0, 40, 15, 22)
         st.plotly_chart(fig, use_container_width=True)
 
 
@@ -211,55 +228,46 @@ def render_consecutive_loss_tracker(metrics: Dict[str, Any]) -> None:
         st.info("No consecutive loss data available")
         return
 
-    data = []
+    # Display as one HTML table
+    rows = []
     for bot_id, count in consecutive_losses.items():
         status = "✅ Safe" if count < 2 else "⚠️ Warning" if count < 3 else "🛑 HALT"
         color = "#22c55e" if count < 2 else "#f59e0b" if count < 3 else "#ef4444"
 
-        data.append({"Bot": bot_id, "Consecutive Losses": count, "Status": status, "Color": color})
-
-    df = pd.DataFrame(data)
-
-    # Display as table
-    for _, row in df.iterrows():
-        col1, col2, col3 = st.columns([2, 2, 2])
-        with col1:
-            st.markdown(f"**{row['Bot']}**")
-        with col2:
-            st.progress(min(row["Consecutive Losses"] / 3.0, 1.0))
-            st.caption(f"{row['Consecutive Losses']} / 3")
-        with col3:
-            st.markdown(
-                f"<span style='color: {row['Color']};'>{row['Status']}</span>",
-                unsafe_allow_html=True,
-            )
+        rows.append(
+            f"<tr><td><b>{bot_id}</b></td>"
+            f"<td><progress value='{min(count, 3)}' max='3' style='width: 100%;'></progress>"
+            f"<br><small style='color: #9ca3af;'>{count} / 3</small></td>"
+            f"<td><span style='color: {color};'>{status}</span></td></tr>"
+        )
 
+    st.markdown(
+        f"<table style='width: 100%;'>{''.join(rows)}</table>",
+        unsafe_allow_html=True,
+    )
 
-def render_risk_alerts_feed() -> None:
-    """Render real-time risk alerts feed."""
-    st.markdown("### Risk Alerts Feed")
 
-    # Mock alerts (replace with WebSocket stream)
-    alerts = [
-        {
-            "timestamp": "2026-02-13 01:45:23",
-            "severity": "WARNING",
-            "type": "ZONE_VIOLATION",
-            "message": "Bot-08: Zone 4 exposure 22% exceeds 20% limit",
-        },
-        {
-            "timestamp": "2026-02-13 01:40:15",
-            "severity": "INFO",
-            "type": "DRAWDOWN_WARNING",
-            "message": "Bot-05: Drawdown reached 18%",
-        },
-        {
-            "timestamp": "2026-02-13 01:35:08",
-            "severity": "CRITICAL",
-            "type": "CIRCUIT_BREAKER",
-            "message": "Bot-02: 3 consecutive losses - PAUSED",
-        },
-    ]
+def alert_html(alert: Dict[str, Any]) -> str:
+    """Render one risk alert as an HTML card."""
+    color, emoji = SEVERITY_STYLES.get(alert["severity"], SEVERITY_STYLES["CRITICAL"])
+
+    return (
+        f"<div style='padding: 10px; border-left: 4px solid {color}; margin-bottom: 10px; background-color: rgba(255,255,255,0.05);'>"
+        f"<small style='color: #9ca3af;'>{escape(str(alert['timestamp']))}</small><br>"
+        f"<span style='color: {color}; font-weight: 600;'>{emoji} {escape(str(alert['severity']))}</span>"
+        f" - {escape(str(alert['type']))}<br>"
+        f"{escape(str(alert['message']))}"
+        f"</div>"
+    )
+
+
+def render_risk_alerts_feed(alerts: List[Dict[str, Any]]) -> None:
+    """Render risk alerts feed.
+
+    Args:
+        alerts: Recent alerts from the risk metrics snapshot
+    """
+    st.markdown("### Risk Alerts Feed")
 
     # Filter
     severity_filter = st.multiselect(
@@ -268,61 +276,60 @@ def render_risk_alerts_feed() -> None:
 
     filtered_alerts = [a for a in alerts if a["severity"] in severity_filter]
 
-    # Display alerts
-    for alert in filtered_alerts:
-        severity = alert["severity"]
-        color = (
-            "#3b82f6" if severity == "INFO" else "#f59e0b" if severity == "WARNING" else "#ef4444"
-        )
-        emoji = "🔵" if severity == "INFO" else "⚠️" if severity == "WARNING" else "🛑"
-
-        st.markdown(
-            f"<div style='padding: 10px; border-left: 4px solid {color}; margin-bottom: 10px; background-color: rgba(255,255,255,0.05);'>"
-            f"<small style='color: #9ca3af;'>{alert['timestamp']}</small><br>"
-            f"<span style='color: {color}; font-weight: 600;'>{emoji} {alert['severity']}</span> - {alert['type']}<br>"
-            f"{alert['message']}"
-            f"</div>",
-            unsafe_allow_html=True,
-        )
+    # Display alerts as one block
+    st.markdown("".join(alert_html(alert) for alert in filtered_alerts), unsafe_allow_html=True)
 
 
-# Main layout
-col1, col2 = st.columns([2, 1])
+# Auto-refresh
+auto_refresh = st.checkbox("Auto-refresh (1s)", value=True)
 
-with col1:
-    # Fetch metrics
-    metrics = asyncio.run(get_risk_metrics())
 
-    # Zone exposure
+# Each section reruns on its own tick; load_risk_state is memoized, so
+# sections refreshing together share one request pair
+@st.fragment(run_every="1s" if auto_refresh else None)
+def render_exposure_section() -> None:
+    """Zone exposure grid and drawdown gauges."""
+    metrics, _ = load_risk_state()
+
     render_zone_exposure_grid(metrics)
 
     st.markdown("---")
 
-    # Drawdown gauges
     render_drawdown_gauges(metrics)
 
-with col2:
-    # Circuit breakers
-    circuit_breakers = asyncio.run(get_circuit_breakers())
+
+@st.fragment(run_every="1s" if auto_refresh else None)
+def render_breaker_section() -> None:
+    """Circuit breakers and consecutive loss tracker."""
+    metrics, circuit_breakers = load_risk_state()
+
     render_circuit_breakers(circuit_breakers)
 
     st.markdown("---")
 
-    # Consecutive loss tracker
     render_consecutive_loss_tracker(metrics)
 
-# Risk alerts feed
-st.markdown("---")
-render_risk_alerts_feed()
 
-# Auto-refresh
-auto_refresh = st.checkbox("Auto-refresh (1s)", value=True)
+@st.fragment(run_every="1s" if auto_refresh else None)
+def render_alerts_section() -> None:
+    """Risk alerts feed from the metrics snapshot."""
+    metrics, _ = load_risk_state()
+
+    render_risk_alerts_feed(metrics.get("recent_alerts", []))
 
-if auto_refresh:
-    import time
 
-    time.sleep(1)
-    st.rerun()
+# Main layout
+col1, col2 = st.columns([2, 1])
+
+with col1:
+    render_exposure_section()
+
+with col2:
+    render_breaker_section()
+
+# Risk alerts feed
+st.markdown("---")
+render_alerts_section()
 
 # Footer
 st.markdown("---")
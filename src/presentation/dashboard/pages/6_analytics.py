@@ -1,8 +1,9 @@
 """Analytics page."""
 
+import plotly.graph_objects as go
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 from src.presentation.dashboard.components.charts import (
     create_equity_curve,
     create_pnl_chart,
@@ -13,13 +14,31 @@ st.set_page_config(page_title="Analytics", page_icon="📈", layout="wide")
 st.title("📈 Analytics")
 
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_analytics(base_url: str) -> tuple:
+    """Performance and portfolio metrics, memoized across reruns."""
+    client = get_api_client(base_url)
+    return client.get_performance_metrics(), client.get_portfolio_metrics()
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _equity_figure(points: tuple) -> go.Figure:
+    """Equity curve for (date, value) points, shared read-only across reruns."""
+    return create_equity_curve([{"date": d, "value": v} for d, v in points])
+
+
+@st.cache_resource(ttl=60, show_spinner=False)
+def _pnl_figure(points: tuple) -> go.Figure:
+    """Daily P&L chart for (date, pnl) points, shared read-only across reruns."""
+    return create_pnl_chart([{"date": d, "pnl": p} for d, p in points])
+
 
 # Fetch metrics
 try:
-    performance = client.get_performance_metrics()
-    portfolio = client.get_portfolio_metrics()
+    performance, portfolio = _fetch_analytics(client.base_url)
 except Exception as e:
     st.error(f"Failed to fetch analytics: {e}")
     st.stop()
@@ -64,8 +83,10 @@ equity_data = [
     {"date": "2025-02-06", "value": 10500},
 ]
 
-fig = create_equity_curve(equity_data)
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(
+    _equity_figure(tuple((d["date"], d["value"]) for d in equity_data)),
+    use_container_width=True,
+)
 
 st.markdown("---")
 
@@ -82,8 +103,10 @@ pnl_data = [
     {"date": "2025-02-06", "pnl": 150},
 ]
 
-fig = create_pnl_chart(pnl_data)
-st.plotly_chart(fig, use_container_width=True)
+st.plotly_chart(
+    _pnl_figure(tuple((d["date"], d["pnl"]) for d in pnl_data)),
+    use_container_width=True,
+)
 
 st.markdown("---")
 
@@ -1,16 +1,18 @@
 """Settings page - System configuration and health.
 
-Global config, bot-specific settings, notifications, database, and system health.
+Global config, bot-specific settings, notifications, database, system health,
+and dashboard connection settings.
 """
 
-import asyncio
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 
-import pandas as pd
 import streamlit as st
-import yaml
 
-from ..components.api_client import APIClient
+from src.presentation.dashboard._client import (
+    API_BASE_URL,
+    get_api_client,
+    get_connection,
+)
 
 # Page config
 st.set_page_config(
@@ -25,23 +27,60 @@ st.title("⚙️ Settings")
 st.markdown("System configuration and health monitoring")
 
 # Initialize API client
-api_client = APIClient(base_url="http://localhost:8000", api_key="your-api-key-here")
-
-
-async def get_global_config() -> Dict[str, Any]:
-    """Fetch global configuration."""
-    try:
-        response = await api_client.get("/api/v1/config/global")
-        return response
-    except Exception as e:
-        st.error(f"Error fetching global config: {e}")
-        return {}
-
-
-async def save_global_config(config: Dict[str, Any]) -> bool:
+api_client = get_connection()
+
+# Service status grid (sample data until the API reports per-service stats)
+SERVICES = [
+    {"name": "API (FastAPI)", "status": "RUNNING", "cpu": 12, "memory": 256},
+    {"name": "Dashboard (Streamlit)", "status": "RUNNING", "cpu": 8, "memory": 180},
+    {"name": "TimescaleDB", "status": "RUNNING", "cpu": 25, "memory": 512},
+    {"name": "Redis", "status": "RUNNING", "cpu": 3, "memory": 64},
+    {"name": "WebSocket Gateway", "status": "RUNNING", "cpu": 5, "memory": 128},
+    {"name": "Bot-01", "status": "ACTIVE", "cpu": 2, "memory": 48},
+    {"name": "Bot-05", "status": "ACTIVE", "cpu": 4, "memory": 52},
+    {"name": "Bot-08", "status": "ACTIVE", "cpu": 3, "memory": 50},
+]
+
+# Service status -> emoji; anything else is shown as failed
+SERVICE_STATUS_EMOJI = {"RUNNING": "🟢", "ACTIVE": "🟢", "PAUSED": "🟡"}
+
+# Bot ID -> strategy name
+BOT_NAMES = {
+    "bot-01": "Rebalancing",
+    "bot-02": "Esports",
+    "bot-03": "Copy Trading",
+    "bot-04": "News-driven",
+    "bot-05": "Market Making",
+    "bot-06": "Multi-outcome",
+    "bot-07": "Contrarian",
+    "bot-08": "Tail Risk",
+    "bot-09": "Kelly Optimizer",
+    "bot-10": "Long-term Value",
+}
+
+# Bot selector labels, built once per process
+BOT_LABELS = {
+    bot_id: f"Bot {bot_id.split('-')[1]} - {name}" for bot_id, name in BOT_NAMES.items()
+}
+
+KELLY_FRACTIONS = ["Quarter", "Half", "Full"]
+
+
+def option_index(options: List[str], value: Any) -> int:
+    """Index of a saved value in a selectbox's options; 0 if unknown."""
+    return options.index(value) if value in options else 0
+
+
+def clamp(value: Any, min_value: float, max_value: float) -> float:
+    """Clamp a saved value into a widget's range, in the range's type."""
+    return type(min_value)(min(max(float(value), min_value), max_value))
+
+
+def save_global_config(config: Dict[str, Any]) -> bool:
     """Save global configuration."""
     try:
-        await api_client.put("/api/v1/config/global", data=config)
+        api_client.put("/api/v1/config/global", json=config)
+        load_settings.clear()
         st.success("Global configuration saved successfully")
         return True
     except Exception as e:
@@ -49,20 +88,34 @@ async def save_global_config(config: Dict[str, Any]) -> bool:
         return False
 
 
-async def get_bot_config(bot_id: str) -> Dict[str, Any]:
-    """Fetch bot-specific configuration."""
-    try:
-        response = await api_client.get(f"/api/v1/config/bots/{bot_id}")
-        return response
-    except Exception as e:
-        st.error(f"Error fetching bot config: {e}")
-        return {}
+@st.cache_data(ttl=15, show_spinner=False)
+def load_settings(bot_id: str) -> Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]:
+    """Fetch global config, one bot's config and system health together.
+
+    The three requests overlap on the shared connection; a failed one
+    shows its error and yields an empty dict without hiding the others.
+    """
+    results = api_client.gather(
+        api_client.client.get("/api/v1/config/global"),
+        api_client.client.get(f"/api/v1/config/bots/{bot_id}"),
+        api_client.client.get("/health/ready"),
+        return_exceptions=True,
+    )
+
+    labels = ["global config", "bot config", "system health"]
+    for i, (label, result) in enumerate(zip(labels, results)):
+        if isinstance(result, Exception):
+            st.error(f"Error fetching {label}: {result}")
+            results[i] = {}
 
+    return tuple(results)
 
-async def save_bot_config(bot_id: str, config: Dict[str, Any]) -> bool:
+
+def save_bot_config(bot_id: str, config: Dict[str, Any]) -> bool:
     """Save bot-specific configuration."""
     try:
-        await api_client.put(f"/api/v1/config/bots/{bot_id}", data=config)
+        api_client.put(f"/api/v1/config/bots/{bot_id}", json=config)
+        load_settings.clear()
         st.success(f"Bot {bot_id} configuration saved successfully")
         return True
     except Exception as e:
@@ -70,20 +123,14 @@ async def save_bot_config(bot_id: str, config: Dict[str, Any]) -> bool:
         return False
 
 
-async def get_system_health() -> Dict[str, Any]:
-    """Fetch system health metrics."""
-    try:
-        response = await api_client.get("/health/ready")
-        return response
-    except Exception as e:
-        st.error(f"Error fetching system health: {e}")
-        return {}
-
-
-def render_global_config_tab() -> None:
-    """Render global configuration tab."""
+@st.fragment
+def render_global_config_tab(global_config: Dict[str, Any]) -> None:
+    """Render global configuration tab, pre-filled from the saved config."""
     st.markdown("### Global Configuration")
 
+    risk = global_config.get("risk", {})
+    trading = global_config.get("trading", {})
+
     # Emergency controls
     st.markdown("**Emergency Controls**")
     col1, col2, col3 = st.columns(3)
@@ -109,18 +156,34 @@ def render_global_config_tab() -> None:
 
     with col1:
         max_portfolio_dd = st.slider(
-            "Max Portfolio Drawdown %", min_value=10, max_value=50, value=40, step=5
+            "Max Portfolio Drawdown %",
+            min_value=10,
+            max_value=50,
+            value=clamp(risk.get("max_portfolio_drawdown_pct", 40), 10, 50),
+            step=5,
         )
         max_daily_loss = st.slider(
-            "Max Daily Loss %", min_value=1, max_value=10, value=5, step=1
+            "Max Daily Loss %",
+            min_value=1,
+            max_value=10,
+            value=clamp(risk.get("max_daily_loss_pct", 5), 1, 10),
+            step=1,
         )
 
     with col2:
         max_bot_dd = st.slider(
-            "Max Bot Drawdown %", min_value=10, max_value=40, value=25, step=5
+            "Max Bot Drawdown %",
+            min_value=10,
+            max_value=40,
+            value=clamp(risk.get("max_bot_drawdown_pct", 25), 10, 40),
+            step=5,
         )
         consecutive_loss_limit = st.slider(
-            "Consecutive Loss Limit", min_value=2, max_value=5, value=3, step=1
+            "Consecutive Loss Limit",
+            min_value=2,
+            max_value=5,
+            value=clamp(risk.get("consecutive_loss_limit", 3), 2, 5),
+            step=1,
         )
 
     # Trading parameters
@@ -129,16 +192,27 @@ def render_global_config_tab() -> None:
     col1, col2 = st.columns(2)
 
     with col1:
+        order_types = ["POST_ONLY", "MARKET", "LIMIT"]
         default_order_type = st.selectbox(
-            "Default Order Type", ["POST_ONLY", "MARKET", "LIMIT"], index=0
+            "Default Order Type",
+            order_types,
+            index=option_index(order_types, trading.get("default_order_type")),
         )
         max_slippage = st.slider(
-            "Max Slippage Tolerance %", min_value=0.1, max_value=2.0, value=0.5, step=0.1
+            "Max Slippage Tolerance %",
+            min_value=0.1,
+            max_value=2.0,
+            value=clamp(trading.get("max_slippage_pct", 0.5), 0.1, 2.0),
+            step=0.1,
         )
 
     with col2:
         rate_limit_per_min = st.number_input(
-            "Rate Limit (requests/min)", min_value=10, max_value=200, value=100, step=10
+            "Rate Limit (requests/min)",
+            min_value=10,
+            max_value=200,
+            value=clamp(trading.get("rate_limit_per_min", 100), 10, 200),
+            step=10,
         )
 
     # Save button
@@ -156,22 +230,26 @@ def render_global_config_tab() -> None:
                 "rate_limit_per_min": rate_limit_per_min,
             },
         }
-        asyncio.run(save_global_config(config))
+        save_global_config(config)
 
 
+@st.fragment
 def render_bot_config_tab() -> None:
-    """Render bot-specific configuration tab."""
+    """Render bot-specific configuration tab for the selected bot."""
+    import yaml
+
     st.markdown("### Bot-Specific Configuration")
 
     # Bot selector
     bot_id = st.selectbox(
         "Select Bot",
-        [f"bot-{i:02d}" for i in range(1, 11)],
-        format_func=lambda x: f"Bot {x.split('-')[1]} - {get_bot_name(x)}",
+        list(BOT_LABELS),
+        format_func=BOT_LABELS.__getitem__,
+        key="settings_bot_id",
     )
 
-    # Fetch bot config
-    bot_config = asyncio.run(get_bot_config(bot_id))
+    # Cached by the page-level prefetch unless the selection just changed
+    _, bot_config, _ = load_settings(bot_id)
 
     # Config editor
     col1, col2 = st.columns(2)
@@ -181,21 +259,21 @@ def render_bot_config_tab() -> None:
             "Capital Allocated ($)",
             min_value=100,
             max_value=10000,
-            value=bot_config.get("capital_allocated", 1000),
+            value=clamp(bot_config.get("capital_allocated", 1000), 100, 10000),
             step=100,
         )
 
         kelly_fraction = st.selectbox(
             "Kelly Fraction",
-            ["Quarter", "Half", "Full"],
-            index=["Quarter", "Half", "Full"].index(bot_config.get("kelly_fraction", "Half")),
+            KELLY_FRACTIONS,
+            index=option_index(KELLY_FRACTIONS, bot_config.get("kelly_fraction", "Half")),
         )
 
         max_position_size = st.number_input(
             "Max Position Size ($)",
             min_value=10,
             max_value=5000,
-            value=bot_config.get("max_position_size", 500),
+            value=clamp(bot_config.get("max_position_size", 500), 10, 5000),
             step=10,
         )
 
@@ -231,7 +309,7 @@ def render_bot_config_tab() -> None:
                     "enabled": bot_enabled,
                     "strategy_config": strategy_config,
                 }
-                asyncio.run(save_bot_config(bot_id, config))
+                save_bot_config(bot_id, config)
             except yaml.YAMLError as e:
                 st.error(f"Invalid YAML: {e}")
 
@@ -242,21 +320,10 @@ def render_bot_config_tab() -> None:
 
 def get_bot_name(bot_id: str) -> str:
     """Get bot strategy name."""
-    names = {
-        "bot-01": "Rebalancing",
-        "bot-02": "Esports",
-        "bot-03": "Copy Trading",
-        "bot-04": "News-driven",
-        "bot-05": "Market Making",
-        "bot-06": "Multi-outcome",
-        "bot-07": "Contrarian",
-        "bot-08": "Tail Risk",
-        "bot-09": "Kelly Optimizer",
-        "bot-10": "Long-term Value",
-    }
-    return names.get(bot_id, "Unknown")
+    return BOT_NAMES.get(bot_id, "Unknown")
 
 
+@st.fragment
 def render_notifications_tab() -> None:
     """Render notifications configuration tab."""
     st.markdown("### Notification Settings")
@@ -296,6 +363,7 @@ def render_notifications_tab() -> None:
         st.info("Test notification sent")
 
 
+@st.fragment
 def render_database_tab() -> None:
     """Render database status and maintenance tab."""
     st.markdown("### Database Status")
@@ -352,38 +420,27 @@ def render_database_tab() -> None:
             st.info("Exporting database snapshot...")
 
 
-def render_system_health_tab() -> None:
+@st.fragment
+def render_system_health_tab(health: Dict[str, Any]) -> None:
     """Render system health monitoring tab."""
     st.markdown("### System Health")
 
+    st.caption(f"API readiness: {health.get('status', 'unknown')}")
+
     # Service status grid
     st.markdown("**Service Status**")
 
-    services = [
-        {"name": "API (FastAPI)", "status": "RUNNING", "cpu": 12, "memory": 256},
-        {"name": "Dashboard (Streamlit)", "status": "RUNNING", "cpu": 8, "memory": 180},
-        {"name": "TimescaleDB", "status": "RUNNING", "cpu": 25, "memory": 512},
-        {"name": "Redis", "status": "RUNNING", "cpu": 3, "memory": 64},
-        {"name": "WebSocket Gateway", "status": "RUNNING", "cpu": 5, "memory": 128},
-        {"name": "Bot-01", "status": "ACTIVE", "cpu": 2, "memory": 48},
-        {"name": "Bot-05", "status": "ACTIVE", "cpu": 4, "memory": 52},
-        {"name": "Bot-08", "status": "ACTIVE", "cpu": 3, "memory": 50},
-    ]
-
-    df = pd.DataFrame(services)
+    import pandas as pd
 
-    # Color-code status
-    def color_status(val: str) -> str:
-        if val in ["RUNNING", "ACTIVE"]:
-            return "background-color: rgba(34, 197, 94, 0.2);"
-        elif val == "PAUSED":
-            return "background-color: rgba(245, 158, 11, 0.2);"
-        else:
-            return "background-color: rgba(239, 68, 68, 0.2);"
+    df = pd.DataFrame(SERVICES)
 
-    styled_df = df.style.applymap(color_status, subset=["status"])
+    # Status emoji instead of a Styler; st.table renders the cells as is
+    df["status"] = df["status"].map(SERVICE_STATUS_EMOJI).fillna("🔴") + " " + df["status"]
+    df["cpu"] = df["cpu"].astype(str) + "%"
+    df["memory"] = df["memory"].astype(str) + " MB"
 
-    st.dataframe(styled_df, use_container_width=True, hide_index=True)
+    # A handful of fixed rows: a static table, not the interactive grid
+    st.table(df.set_index("name"))
 
     st.markdown("---")
 
@@ -401,14 +458,20 @@ def render_system_health_tab() -> None:
     with col3:
         live_tail = st.checkbox("Live Tail", value=False)
 
-    # Mock logs
-    logs = [
-        "[2026-02-13 01:55:00] [INFO] [API] Received order placement request",
-        "[2026-02-13 01:54:58] [INFO] [Bot-08] Position opened: market-123",
-        "[2026-02-13 01:54:55] [WARNING] [Bot-05] Slippage 0.4% on fill",
-    ]
+    # Only the log viewer reruns on the tail tick; the services table and
+    # the other tabs stay put
+    @st.fragment(run_every="1s" if live_tail else None)
+    def render_log_tail() -> None:
+        # Mock logs
+        logs = [
+            "[2026-02-13 01:55:00] [INFO] [API] Received order placement request",
+            "[2026-02-13 01:54:58] [INFO] [Bot-08] Position opened: market-123",
+            "[2026-02-13 01:54:55] [WARNING] [Bot-05] Slippage 0.4% on fill",
+        ]
 
-    st.text_area("Logs", value="\n".join(logs), height=200, disabled=True)
+        st.text_area("Logs", value="\n".join(logs), height=200, disabled=True)
+
+    render_log_tail()
 
     # Actions
     col1, col2 = st.columns(2)
@@ -422,13 +485,108 @@ def render_system_health_tab() -> None:
             st.warning("Logs cleared")
 
 
-# Main tabs
-tab1, tab2, tab3, tab4, tab5 = st.tabs(
-    ["🌍 Global", "🤖 Bots", "🔔 Notifications", "💾 Database", "❤️ Health"]
+@st.fragment
+def render_dashboard_tab() -> None:
+    """Render dashboard connection, refresh, theme and system info tab."""
+    st.markdown("### API Connection")
+
+    api_base_url = st.text_input(
+        "API Endpoint",
+        value=st.session_state.get("api_base_url", API_BASE_URL),
+        help="FastAPI backend URL",
+    )
+
+    if st.button("🔌 Test Connection"):
+        try:
+            response = get_api_client(api_base_url).health_check()
+            st.success(f"✅ Connected: {api_base_url} - {response['status']}")
+            st.session_state["api_base_url"] = api_base_url
+        except Exception as e:
+            st.error(f"❌ Connection failed: {e}")
+
+    st.markdown("---")
+
+    st.markdown("### Auto-refresh")
+
+    auto_refresh = st.checkbox(
+        "Auto-refresh",
+        value=st.session_state.get("auto_refresh", True),
+    )
+
+    if auto_refresh:
+        st.session_state["refresh_rate"] = st.slider(
+            "Refresh rate (seconds)",
+            10, 120, 30,
+            help="How often to refresh data",
+        )
+
+    st.session_state["auto_refresh"] = auto_refresh
+
+    st.markdown("---")
+
+    st.markdown("### 🎨 Theme")
+
+    themes = ["Light", "Dark"]
+    st.session_state["theme"] = st.selectbox(
+        "Color Theme",
+        themes,
+        index=themes.index(st.session_state.get("theme", "Dark")),
+    )
+    st.info("Theme changes require page refresh")
+
+    st.markdown("---")
+
+    st.markdown("### 🗄️ Database Health")
+
+    try:
+        readiness = get_api_client(api_base_url).health_check()
+    except Exception as e:
+        st.error(f"❌ Database health check failed: {e}")
+    else:
+        for name, key in (("TimescaleDB", "database"), ("Redis", "redis")):
+            if readiness.get(key):
+                st.success(f"✅ {name}: Connected")
+            else:
+                st.error(f"❌ {name}: Unavailable")
+
+    st.markdown("---")
+
+    st.markdown("### ℹ️ System Info")
+
+    st.info("""
+**PETS - Polymarket Elite Trading System**
+
+Version: 1.0.0
+
+Stack:
+- Python 3.11+
+- FastAPI (Backend)
+- Streamlit (Dashboard)
+- TimescaleDB (Time-series data)
+- Redis (Caching)
+- Web3.py (Blockchain)
+
+Bot 8: Volatility Skew Arbitrage
+- Evidence: $106K profit from manual trading
+- Strategy: ATH/ATL spread >15%, entry <0.20 or >0.80
+- Hold: 24-48h mean reversion
+- Exit: 0.25-0.35 delta improvement OR 10% stop-loss
+""")
+
+
+# Prefetch every tab's data in one round trip; the bot tab's selector
+# value is known from session state before it is drawn
+global_config, _, health = load_settings(
+    st.session_state.get("settings_bot_id", "bot-01")
+)
+
+# Main tabs; each tab is a fragment, so editing one reruns only that tab
+tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs(
+    ["🌍 Global", "🤖 Bots", "🔔 Notifications", "💾 Database", "❤️ Health", "🖥️ Dashboard"]
 )
 
 with tab1:
-    render_global_config_tab()
+    render_global_config_tab(global_config)
 
 with tab2:
     render_bot_config_tab()
@@ -440,7 +598,10 @@ with tab4:
     render_database_tab()
 
 with tab5:
-    render_system_health_tab()
+    render_system_health_tab(health)
+
+with tab6:
+    render_dashboard_tab()
 
 # Footer
 st.markdown("---")
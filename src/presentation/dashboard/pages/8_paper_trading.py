@@ -1,8 +1,12 @@
 """Paper Trading page."""
 
+import math
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
 import streamlit as st
 
-from src.presentation.dashboard.components.api_client import APIClient
+from src.presentation.dashboard._client import API_BASE_URL, get_api_client
 
 st.set_page_config(page_title="Paper Trading", page_icon="🧪", layout="wide")
 
@@ -20,15 +24,128 @@ Test Bot 8 Volatility Skew strategy with simulated capital before going live.
 
 st.markdown("---")
 
+# Rows rendered per positions table page
+PAGE_SIZE = 50
+
+# Position fields used by the tables; missing keys become NaN columns
+POSITION_FIELDS = [
+    "market_id", "side", "size", "entry_price", "current_price",
+    "exit_price", "unrealized_pnl", "realized_pnl", "zone", "is_open",
+]
+
+# Client-side column widths and number formats for the position tables
+POSITION_COLUMN_CONFIG = {
+    "Market": st.column_config.TextColumn(width="medium"),
+    "Size": st.column_config.NumberColumn(format="$%.0f"),
+    "Entry": st.column_config.NumberColumn(format="%.4f"),
+    "Current": st.column_config.NumberColumn(format="%.4f"),
+    "Exit": st.column_config.NumberColumn(format="%.4f"),
+    "Unrealized P&L": st.column_config.NumberColumn(format="$%.2f"),
+    "Realized P&L": st.column_config.NumberColumn(format="$%.2f"),
+    "P&L %": st.column_config.NumberColumn(format="%.2f%%"),
+}
+
 # API client
-api_base_url = st.session_state.get("api_base_url", "http://localhost:8000")
-client = APIClient(api_base_url)
+client = get_api_client(st.session_state.get("api_base_url", API_BASE_URL))
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _fetch_paper(base_url: str) -> tuple:
+    """Paper wallet, metrics and positions, memoized across reruns."""
+    summary = get_api_client(base_url).get_paper_summary()
+    return summary["wallet"], summary["metrics"], summary["positions"]
+
+
+def _paginate(rows: pd.DataFrame, key: str, page_size: int = PAGE_SIZE) -> pd.DataFrame:
+    """Slice of ``rows`` for the page picked in a per-table page selector."""
+    total_pages = max(1, math.ceil(len(rows) / page_size))
+    if total_pages == 1:
+        return rows
+    page = st.number_input(
+        f"Page (of {total_pages})", min_value=1, max_value=total_pages, value=1, key=key
+    )
+    return rows.iloc[(page - 1) * page_size:page * page_size]
+
+
+def _position_columns(page: pd.DataFrame) -> dict:
+    """Display columns shared by the open and closed position tables."""
+    return {
+        "Market": page["market_id"],
+        "Side": page["side"],
+        "Size": page["size"],
+        "Entry": page["entry_price"],
+    }
+
+
+@st.cache_resource
+def _reset_executor() -> ThreadPoolExecutor:
+    """Worker that runs wallet resets off the script thread."""
+    return ThreadPoolExecutor(max_workers=1, thread_name_prefix="paper-reset")
+
+
+@st.fragment(run_every="1s")
+def _render_reset_status() -> None:
+    """Poll the pending wallet reset; rerun the page once it settles."""
+    future = st.session_state["reset_future"]
+    if not future.done():
+        st.info("⏳ Resetting paper wallet...")
+        return
+
+    del st.session_state["reset_future"]
+    try:
+        st.session_state["reset_outcome"] = (True, future.result()["message"])
+        _fetch_paper.clear()
+    except Exception as e:
+        st.session_state["reset_outcome"] = (False, str(e))
+    st.rerun()
+
+
+@st.fragment
+def render_open_positions(open_df: pd.DataFrame) -> None:
+    """Render the open positions table; paging reruns only this table."""
+    if open_df.empty:
+        st.info("No open paper positions")
+        return
+
+    page = _paginate(open_df, key="paper_open_page")
+    st.dataframe(
+        pd.DataFrame({
+            **_position_columns(page),
+            "Current": page["current_price"],
+            "Unrealized P&L": page["unrealized_pnl"],
+            "Zone": page["zone"],
+        }),
+        column_config=POSITION_COLUMN_CONFIG,
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+@st.fragment
+def render_closed_positions(closed_df: pd.DataFrame) -> None:
+    """Render the closed positions table; paging reruns only this table."""
+    if closed_df.empty:
+        st.info("No closed paper positions yet")
+        return
+
+    page = _paginate(closed_df, key="paper_closed_page")
+    st.dataframe(
+        pd.DataFrame({
+            **_position_columns(page),
+            "Exit": page["exit_price"],
+            "Realized P&L": page["realized_pnl"],
+            "P&L %": page["realized_pnl"] / page["size"].where(page["size"].ne(0)) * 100,
+            "Zone": page["zone"],
+        }),
+        column_config=POSITION_COLUMN_CONFIG,
+        use_container_width=True,
+        hide_index=True,
+    )
+
 
 # Fetch paper wallet
 try:
-    wallet = client.get_paper_wallet()
-    metrics = client.get_paper_metrics()
-    positions = client.get_paper_positions()
+    wallet, metrics, positions = _fetch_paper(client.base_url)
 except Exception as e:
     st.error(f"Failed to fetch paper trading data: {e}")
     st.stop()
@@ -105,50 +222,21 @@ st.subheader("💼 Paper Positions")
 
 tab1, tab2 = st.tabs(["📈 Open Positions", "📊 Closed Positions"])
 
+positions_df = pd.DataFrame(positions, columns=POSITION_FIELDS)
+
+# Label zones up front; a missing zone reads N/A instead of "Znan"
+zones = positions_df["zone"]
+positions_df["zone"] = ("Z" + zones.astype("Int64").astype(str)).where(zones.notna(), "N/A")
+
+# A missing is_open flag is NaN, which astype(bool) would treat as open
+is_open = positions_df["is_open"].fillna(False).astype(bool)
+open_df, closed_df = positions_df[is_open], positions_df[~is_open]
+
 with tab1:
-    open_positions = [pos for pos in positions if pos['is_open']]
-    
-    if open_positions:
-        st.dataframe(
-            [
-                {
-                    "Market": pos["market_id"][:16] + "...",
-                    "Side": pos["side"],
-                    "Size": f"${pos['size']:,.0f}",
-                    "Entry": f"{pos['entry_price']:.4f}",
-                    "Current": f"{pos['current_price']:.4f}" if pos['current_price'] else "N/A",
-                    "Unrealized P&L": f"${pos['unrealized_pnl']:,.2f}" if pos['unrealized_pnl'] else "N/A",
-                    "Zone": f"Z{pos['zone']}",
-                }
-                for pos in open_positions
-            ],
-            use_container_width=True,
-        )
-    else:
-        st.info("No open paper positions")
+    render_open_positions(open_df)
 
 with tab2:
-    closed_positions = [pos for pos in positions if not pos['is_open']]
-    
-    if closed_positions:
-        st.dataframe(
-            [
-                {
-                    "Market": pos["market_id"][:16] + "...",
-                    "Side": pos["side"],
-                    "Size": f"${pos['size']:,.0f}",
-                    "Entry": f"{pos['entry_price']:.4f}",
-                    "Exit": f"{pos['exit_price']:.4f}" if pos['exit_price'] else "N/A",
-                    "Realized P&L": f"${pos['realized_pnl']:,.2f}" if pos['realized_pnl'] else "N/A",
-                    "P&L %": f"{(pos['realized_pnl']/pos['size']*100):.2f}%" if pos['realized_pnl'] and pos['size'] else "N/A",
-                    "Zone": f"Z{pos['zone']}",
-                }
-                for pos in closed_positions
-            ],
-            use_container_width=True,
-        )
-    else:
-        st.info("No closed paper positions yet")
+    render_closed_positions(closed_df)
 
 st.markdown("---")
 
@@ -161,14 +249,23 @@ with col1:
     st.markdown("**Reset Paper Wallet**")
     st.markdown("Clear all positions and reset balance to $10K")
     
-    if st.button("🔄 Reset Wallet", type="primary"):
+    pending = "reset_future" in st.session_state
+    if st.button("🔄 Reset Wallet", type="primary", disabled=pending):
         try:
-            result = client.reset_paper_wallet()
-            st.success(f"✅ {result['message']}")
-            st.rerun()
+            st.session_state["reset_future"] = _reset_executor().submit(client.reset_paper_wallet)
+            pending = True
         except Exception as e:
             st.error(f"❌ Failed to reset wallet: {e}")
 
+    if pending:
+        _render_reset_status()
+    elif "reset_outcome" in st.session_state:
+        ok, message = st.session_state.pop("reset_outcome")
+        if ok:
+            st.success(f"✅ {message}")
+        else:
+            st.error(f"❌ Failed to reset wallet: {message}")
+
 with col2:
     st.markdown("**Paper Trading Status**")
     if wallet['total_trades'] > 0:
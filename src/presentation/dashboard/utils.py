@@ -4,9 +4,13 @@ Author: Juan [juankaspain]
 Created: 2026-02-13
 """
 
+import os
 from datetime import datetime
 from typing import Optional
 
+# Sample-data fallbacks are only built when PETS_DEMO=1
+DEMO = os.getenv("PETS_DEMO") == "1"
+
 
 def format_currency(amount: float) -> str:
     """Format amount as USD currency.
@@ -0,0 +1,95 @@
+"""Tests for the dashboard API client against the real API routers.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.presentation.api.dependencies import get_bot_orchestrator
+from src.presentation.api.routes import bots
+from src.presentation.dashboard.components.api_client import APIClient
+
+
+class FakeOrchestrator:
+    """Records the per-bot calls made through the bot routes."""
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    async def start_bot(self, bot_id: int) -> None:
+        self.calls.append(("start", bot_id))
+
+    async def stop_bot(self, bot_id: int) -> None:
+        self.calls.append(("stop", bot_id))
+
+    async def pause_bot(self, bot_id: int) -> None:
+        self.calls.append(("pause", bot_id))
+
+
+@pytest.fixture
+def orchestrator() -> FakeOrchestrator:
+    """Orchestrator behind the bot routes."""
+    return FakeOrchestrator()
+
+
+@pytest.fixture
+def client(orchestrator: FakeOrchestrator) -> APIClient:
+    """API client whose session talks to the bots router in-process."""
+    app = FastAPI()
+    app.include_router(bots.router, prefix="/api/v1")
+    app.dependency_overrides[get_bot_orchestrator] = lambda: orchestrator
+
+    api_client = APIClient(base_url="http://testserver")
+    api_client.session = TestClient(app)
+    return api_client
+
+
+def test_batch_post_is_rejected_by_bot_router(client: APIClient) -> None:
+    """/bots/batch matches GET /bots/{bot_id}, so the API answers 405."""
+    response = client.session.post("http://testserver/api/v1/bots/batch", json={})
+
+    assert response.status_code == 405
+
+
+def test_bot_state_change_falls_back_to_per_bot_route(
+    client: APIClient, orchestrator: FakeOrchestrator
+) -> None:
+    """Without a batch route, a state change posts to /bots/{id}/{action}."""
+    result = client.update_bot_state(1, "ANALYZING")
+
+    assert result == {"status": "starting", "bot_id": "1"}
+    assert orchestrator.calls == [("start", 1)]
+
+
+def test_concurrent_bot_ops_each_reach_their_route(
+    client: APIClient, orchestrator: FakeOrchestrator
+) -> None:
+    """Operations batched together still run one per-bot request each."""
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        results = list(
+            pool.map(lambda args: client.update_bot_state(*args), [(2, "STOPPED"), (3, "PAUSED")])
+        )
+
+    assert [r["bot_id"] for r in results] == ["2", "3"]
+    assert sorted(orchestrator.calls) == [("pause", 3), ("stop", 2)]
+
+
+def test_delete_without_route_fails_only_that_operation(
+    client: APIClient, orchestrator: FakeOrchestrator
+) -> None:
+    """The API has no delete route, so deletes fail without a request."""
+    with pytest.raises(NotImplementedError):
+        client.delete_bot(4)
+
+    assert orchestrator.calls == []
+
+
+def test_unknown_bot_state_is_rejected(client: APIClient) -> None:
+    """States without a per-bot route raise instead of guessing one."""
+    with pytest.raises(ValueError):
+        client.update_bot_state(5, "ERROR")
@@ -0,0 +1,168 @@
+"""Tests for GET coalescing in the async dashboard API client.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.presentation.dashboard.api_client import APIClient
+
+
+def make_client(handler) -> APIClient:
+    """API client whose requests are answered in-process by ``handler``."""
+    api_client = APIClient(base_url="http://testserver")
+    api_client.client = httpx.AsyncClient(
+        base_url="http://testserver",
+        transport=httpx.MockTransport(handler),
+        event_hooks={"request": [api_client._detach_pending]},
+    )
+    return api_client
+
+
+def test_identical_concurrent_gets_share_one_request():
+    """GETs with the same path and params in flight together hit the API once."""
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"calls": len(seen)})
+
+    async def scenario():
+        api_client = make_client(handler)
+        try:
+            return await asyncio.gather(
+                api_client.get("/api/v1/bots", {"state": "ANALYZING"}),
+                api_client.get("/api/v1/bots", {"state": "ANALYZING"}),
+            )
+        finally:
+            await api_client.close()
+
+    first, second = asyncio.run(scenario())
+
+    assert len(seen) == 1
+    assert first == second == {"calls": 1}
+
+
+def test_gets_with_different_params_are_not_shared():
+    """Only identical GETs coalesce; other params get their own request."""
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json=dict(request.url.params))
+
+    async def scenario():
+        api_client = make_client(handler)
+        try:
+            return await asyncio.gather(
+                api_client.get("/api/v1/bots", {"state": "ANALYZING"}),
+                api_client.get("/api/v1/bots", {"state": "STOPPED"}),
+            )
+        finally:
+            await api_client.close()
+
+    results = asyncio.run(scenario())
+
+    assert len(seen) == 2
+    assert results == [{"state": "ANALYZING"}, {"state": "STOPPED"}]
+
+
+def test_finished_get_is_not_reused():
+    """A GET issued after the previous one completed sends a new request."""
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={"calls": len(seen)})
+
+    async def scenario():
+        api_client = make_client(handler)
+        try:
+            first = await api_client.get("/api/v1/positions")
+            second = await api_client.get("/api/v1/positions")
+            return first, second
+        finally:
+            await api_client.close()
+
+    assert asyncio.run(scenario()) == ({"calls": 1}, {"calls": 2})
+
+
+def test_failed_get_is_not_reused():
+    """An error reaches the caller and the next GET retries the API."""
+    seen = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        status = 500 if len(seen) == 1 else 200
+        return httpx.Response(status, json={"calls": len(seen)})
+
+    async def scenario():
+        api_client = make_client(handler)
+        try:
+            with pytest.raises(httpx.HTTPStatusError):
+                await api_client.get("/api/v1/positions")
+            return await api_client.get("/api/v1/positions")
+        finally:
+            await api_client.close()
+
+    assert asyncio.run(scenario()) == {"calls": 2}
+
+
+@pytest.mark.parametrize("method", ["post", "put"])
+def test_write_detaches_in_flight_get(method: str):
+    """A GET issued after a write does not join a GET started before it."""
+    gets = []
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            if request.method != "GET":
+                return httpx.Response(200, json={"status": "ok"})
+            gets.append(request)
+            await release.wait()
+            return httpx.Response(200, json={"calls": len(gets)})
+
+        api_client = make_client(handler)
+        try:
+            before = asyncio.create_task(api_client.get("/api/v1/bots/1"))
+            await asyncio.sleep(0)
+            await getattr(api_client, method)("/api/v1/bots/1/stop", json={})
+            after = asyncio.create_task(api_client.get("/api/v1/bots/1"))
+            for _ in range(100):
+                if len(gets) == 2:
+                    break
+                await asyncio.sleep(0)
+            release.set()
+            return await asyncio.gather(before, after)
+        finally:
+            await api_client.close()
+
+    asyncio.run(scenario())
+
+    assert len(gets) == 2
+
+
+def test_circuit_breakers_are_returned_as_a_list():
+    """The circuit-breaker loader gets the endpoint's JSON list unchanged."""
+    breakers = [
+        {"breaker_id": "daily_loss", "is_open": False, "threshold": "5.0", "current_value": "1.2"},
+        {"breaker_id": "portfolio_drawdown", "is_open": True, "threshold": "40.0", "current_value": "41.0"},
+    ]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/api/v1/risk/circuit-breakers"
+        return httpx.Response(200, json=breakers)
+
+    async def scenario():
+        api_client = make_client(handler)
+        try:
+            return await api_client.get_circuit_breakers()
+        finally:
+            await api_client.close()
+
+    assert asyncio.run(scenario()) == breakers
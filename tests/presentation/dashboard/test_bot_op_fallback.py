@@ -0,0 +1,97 @@
+"""Tests for the bot-operation batch fallback in the dashboard API client.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import threading
+
+import orjson
+import pytest
+
+from src.presentation.dashboard.components.api_client import APIClient
+
+
+class FakeResponse:
+    """Minimal ``requests.Response`` with a status and JSON body."""
+
+    def __init__(self, status_code: int, body) -> None:
+        self.status_code = status_code
+        self.content = orjson.dumps(body)
+
+    def raise_for_status(self) -> None:
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeSession:
+    """Answers ``/bots/batch`` with a fixed status and per-bot routes with 200."""
+
+    def __init__(self, batch_status: int) -> None:
+        self.batch_status = batch_status
+        self.posts = []
+        self.lock = threading.Lock()
+
+    def post(self, url: str, json=None) -> FakeResponse:
+        path = url.removeprefix("http://testserver/api/v1")
+        with self.lock:
+            self.posts.append(path)
+        if path == "/bots/batch":
+            if self.batch_status == 200:
+                return FakeResponse(200, {"results": [{"batched": op} for op in json["operations"]]})
+            return FakeResponse(self.batch_status, {"detail": "Not Found"})
+        _, _, bot_id, action = path.split("/")
+        return FakeResponse(200, {"status": action, "bot_id": bot_id})
+
+
+def make_client(batch_status: int) -> APIClient:
+    """API client whose session is a ``FakeSession``."""
+    api_client = APIClient(base_url="http://testserver")
+    api_client.session = FakeSession(batch_status)
+    return api_client
+
+
+@pytest.mark.parametrize("batch_status", [404, 405])
+def test_missing_batch_endpoint_falls_back_to_per_bot_route(batch_status: int) -> None:
+    """404 and 405 from /bots/batch both mean "no batch endpoint"."""
+    client = make_client(batch_status)
+
+    result = client.update_bot_state(7, "PAUSED")
+
+    assert result == {"status": "pause", "bot_id": "7"}
+    assert client.session.posts == ["/bots/batch", "/bots/7/pause"]
+
+
+def test_batch_endpoint_is_used_when_present() -> None:
+    """With a batch endpoint no per-bot request is made."""
+    client = make_client(200)
+
+    result = client.update_bot_state(7, "STOPPED")
+
+    assert result == {"batched": {"bot_id": 7, "op": "update_state", "value": "STOPPED"}}
+    assert client.session.posts == ["/bots/batch"]
+
+
+def test_failed_operation_does_not_fail_its_batch() -> None:
+    """An unsupported op fails alone; the other op in the batch still runs."""
+    client = make_client(405)
+    results = {}
+
+    def run(name, call) -> None:
+        try:
+            results[name] = call()
+        except Exception as e:
+            results[name] = e
+
+    threads = [
+        threading.Thread(target=run, args=("delete", lambda: client.delete_bot(1))),
+        threading.Thread(target=run, args=("stop", lambda: client.update_bot_state(2, "STOPPED"))),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert isinstance(results["delete"], NotImplementedError)
+    assert results["stop"] == {"status": "stop", "bot_id": "2"}
+    assert "/bots/1/delete" not in client.session.posts
@@ -0,0 +1,32 @@
+"""Tests for dashboard chart utilities.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import numpy as np
+
+from src.presentation.dashboard.components.chart_utils import create_latency_histogram
+
+EDGES = [0, 50, 100, 200, np.inf]
+LABELS = ["0-50ms", "50-100ms", "100-200ms", ">200ms"]
+
+
+def test_latency_histogram_renders_p99_marker_on_category_axis():
+    """The p99 marker sits on the bucket's category index and serializes."""
+    latencies = np.array([10.0, 20.0, 60.0, 150.0, 400.0])
+
+    fig = create_latency_histogram(latencies, EDGES, LABELS, "Latency Distribution")
+
+    assert list(fig.data[0].y) == [2, 1, 1, 1]
+    (shape,) = fig.layout.shapes
+    assert shape.x0 == shape.x1 == 3
+    assert fig.layout.annotations[0].text.startswith("p99 ")
+    assert fig.to_json()
+
+
+def test_latency_histogram_marks_first_bucket():
+    """A p99 under the first edge marks category index 0."""
+    fig = create_latency_histogram(np.array([30.0, 40.0]), EDGES, LABELS, "Latency")
+
+    assert fig.layout.shapes[0].x0 == 0
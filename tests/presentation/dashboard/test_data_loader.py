@@ -0,0 +1,50 @@
+"""Tests for dashboard API request batching.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import pytest
+
+from src.presentation.dashboard.components.api_client import DataLoader
+
+
+def test_data_loader_batches_and_dedupes_keys():
+    """Keys queued in one window resolve through a single batch call."""
+    calls = []
+
+    def batch_fn(keys):
+        calls.append(keys)
+        return [key * 2 for key in keys]
+
+    loader = DataLoader(batch_fn, wait_ms=20)
+    futures = [loader.load(1), loader.load(2), loader.load(1)]
+
+    assert [f.result(timeout=1) for f in futures] == [2, 4, 2]
+    assert calls == [[1, 2]]
+
+
+def test_data_loader_propagates_batch_errors():
+    """A failing batch call fails every pending future."""
+
+    def batch_fn(keys):
+        raise ValueError("backend down")
+
+    loader = DataLoader(batch_fn)
+
+    with pytest.raises(ValueError):
+        loader.load("bots").result(timeout=1)
+
+
+def test_data_loader_fails_only_keys_with_error_results():
+    """An exception returned for one key fails only that key's future."""
+
+    def batch_fn(keys):
+        return [ValueError(key) if key == "bad" else key for key in keys]
+
+    loader = DataLoader(batch_fn, wait_ms=20)
+    good, bad = loader.load("good"), loader.load("bad")
+
+    assert good.result(timeout=1) == "good"
+    with pytest.raises(ValueError):
+        bad.result(timeout=1)
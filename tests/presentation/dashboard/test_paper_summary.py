@@ -0,0 +1,126 @@
+"""Tests for the paper-summary loader against the real paper router.
+
+Author: Juan [juankaspain]
+Created: 2026-02-13
+"""
+
+import asyncio
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.domain.entities.paper_position import PaperPosition
+from src.infrastructure.repositories.paper_wallet_repository import (
+    PaperWalletRepository,
+)
+from src.presentation.api.dependencies import get_redis_client
+from src.presentation.api.routes import paper
+from src.presentation.dashboard.components.api_client import APIClient
+
+
+class FakeRedis:
+    """In-memory stand-in for the Redis calls the paper repository makes."""
+
+    def __init__(self) -> None:
+        self.values = {}
+        self.hashes = {}
+        self.reads = []
+
+    async def get(self, key: str):
+        self.reads.append(key)
+        return self.values.get(key)
+
+    async def set(self, key: str, value: str) -> None:
+        self.values[key] = value
+
+    async def hset(self, key: str, field: str, value: str) -> None:
+        self.hashes.setdefault(key, {})[field] = value
+
+    async def hgetall(self, key: str) -> dict:
+        self.reads.append(key)
+        return dict(self.hashes.get(key, {}))
+
+    async def delete(self, *keys: str) -> int:
+        for key in keys:
+            self.values.pop(key, None)
+            self.hashes.pop(key, None)
+        return len(keys)
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    """Redis behind the paper routes."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def client(redis: FakeRedis) -> APIClient:
+    """API client whose session talks to the paper router in-process."""
+    app = FastAPI()
+    app.include_router(paper.router, prefix="/api/v1/paper")
+    app.dependency_overrides[get_redis_client] = lambda: redis
+
+    api_client = APIClient(base_url="http://testserver")
+    api_client.session = TestClient(app)
+    return api_client
+
+
+def test_summary_creates_wallet_on_first_read(client: APIClient, redis: FakeRedis) -> None:
+    """Without a stored wallet the summary saves a fresh one and no positions."""
+    summary = client.get_paper_summary()
+
+    assert summary["wallet"]["balance"] == summary["wallet"]["initial_balance"] == 10000
+    assert summary["metrics"]["total_trades"] == 0
+    assert summary["positions"] == []
+    assert "paper:wallet" in redis.values
+
+
+def test_summary_reads_wallet_and_positions_once(client: APIClient, redis: FakeRedis) -> None:
+    """One summary is one wallet read and one positions read."""
+    client.get_paper_summary()
+    redis.reads.clear()
+
+    client.get_paper_summary()
+
+    assert redis.reads == ["paper:wallet", "paper:positions"]
+
+
+def test_summary_metrics_use_only_closed_positions(client: APIClient, redis: FakeRedis) -> None:
+    """Open positions are listed but do not count towards win/loss metrics."""
+    client.reset_paper_wallet(initial_balance=5000)
+    repo = PaperWalletRepository(redis)
+    wallet = asyncio.run(repo.get_wallet()).record_trade(Decimal("3"))
+    asyncio.run(repo.save_wallet(wallet))
+
+    open_position = PaperPosition(
+        wallet_id=wallet.wallet_id,
+        market_id="0xopen",
+        size=Decimal("10"),
+        entry_price=Decimal("0.5"),
+        current_price=Decimal("0.6"),
+    )
+    closed_position = PaperPosition(
+        wallet_id=wallet.wallet_id,
+        market_id="0xclosed",
+        size=Decimal("10"),
+        entry_price=Decimal("0.4"),
+        closed_at=datetime(2026, 2, 13, 12, 0),
+        exit_price=Decimal("0.7"),
+        realized_pnl=Decimal("3"),
+    )
+    asyncio.run(repo.save_position(open_position))
+    asyncio.run(repo.save_position(closed_position))
+
+    summary = client.get_paper_summary()
+
+    assert summary["wallet"]["initial_balance"] == 5000
+    assert {pos["market_id"]: pos["is_open"] for pos in summary["positions"]} == {
+        "0xopen": True,
+        "0xclosed": False,
+    }
+    assert summary["metrics"]["winning_trades"] == 1
+    assert summary["metrics"]["avg_win"] == 3
+    assert summary["metrics"]["profit_factor"] == 0